@@ -32,6 +32,20 @@ from src.config import (
     GOOGLE_SHEETS_CREDENTIALS,
 )
 
+# District IDs look like "SC-House-042" or "SC-Senate-007"
+_DISTRICT_RE = re.compile(r"SC-((?i:house|senate))-([0-9]+)")
+
+# URL inside a Sheets formula like =HYPERLINK("url", "text")
+_HYPERLINK_RE = re.compile(r'HYPERLINK\("([^"]+)"')
+
+# Upper-cased party spellings -> standard party code
+_PARTY_CANON = {
+    "D": "D", "DEMOCRAT": "D", "DEMOCRATIC": "D",
+    "R": "R", "REPUBLICAN": "R",
+    "I": "I", "INDEPENDENT": "I",
+    "O": "O", "OTHER": "O",
+}
+
 
 def load_party_data() -> dict:
     """
@@ -173,14 +187,9 @@ def normalize_party_code(party: str | None) -> str | None:
 
     party = party.strip().upper()
 
-    if party in ("D", "DEMOCRAT", "DEMOCRATIC"):
-        return "D"
-    elif party in ("R", "REPUBLICAN"):
-        return "R"
-    elif party in ("I", "INDEPENDENT"):
-        return "I"
-    elif party in ("O", "OTHER"):
-        return "O"
+    code = _PARTY_CANON.get(party)
+    if code is not None:
+        return code
 
     return party if len(party) == 1 else None
 
@@ -213,20 +222,11 @@ def parse_district_id(district_id: str) -> tuple[str, int]:
     Returns:
         Tuple of (chamber, district_number) where chamber is 'house' or 'senate'.
     """
-    if not district_id or not district_id.startswith("SC-"):
-        return None, None
-
-    parts = district_id.split("-")
-    if len(parts) != 3:
-        return None, None
-
-    chamber = parts[1].lower()
-    try:
-        district_num = int(parts[2])
-    except ValueError:
+    match = _DISTRICT_RE.fullmatch(district_id) if district_id else None
+    if match is None:
         return None, None
 
-    return chamber, district_num
+    return match.group(1).lower(), int(match.group(2))
 
 
 def export_candidates(output_path: str = None, dry_run: bool = False) -> bool:
@@ -371,7 +371,7 @@ def export_candidates(output_path: str = None, dry_run: bool = False) -> bool:
         # If it's a hyperlink formula, extract the URL
         if ethics_url and ethics_url.startswith("=HYPERLINK"):
             # Extract URL from =HYPERLINK("url", "text")
-            match = re.search(r'HYPERLINK\("([^"]+)"', ethics_url)
+            match = _HYPERLINK_RE.search(ethics_url)
             if match:
                 ethics_url = match.group(1)
 
@@ -10,12 +10,15 @@ Components:
 - CandidateAggregator: Main aggregation orchestrator
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
 from .deduplicator import CandidateDeduplicator
+from .rate_limiter import RateLimiter
 from .sources.base import (
     CandidateSource,
     ConflictRecord,
@@ -116,12 +119,20 @@ class CandidateAggregator:
     Attributes:
         sources: List of CandidateSource instances
         deduplicator: CandidateDeduplicator instance
+        max_parallel_sources: Maximum sources queried concurrently
+        firecrawl_rate_limiter: RateLimiter shared by Firecrawl-backed
+            sources, or None if no source uses Firecrawl
     """
 
+    # Default cap on concurrently running sources
+    MAX_PARALLEL_SOURCES = 10
+
     def __init__(
         self,
         sources: list[CandidateSource],
         similarity_threshold: float = None,
+        max_parallel_sources: int = None,
+        firecrawl_rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize the aggregator with discovery sources.
@@ -129,13 +140,35 @@ class CandidateAggregator:
         Args:
             sources: List of CandidateSource instances to aggregate from
             similarity_threshold: Override for name similarity threshold
+            max_parallel_sources: Override for concurrent source limit
+                (1 queries sources one at a time)
+            firecrawl_rate_limiter: Limiter to share across Firecrawl-backed
+                sources. Defaults to one at the strictest of their own rates.
         """
         # Sort sources by priority (lower = higher priority)
         self.sources = sorted(sources, key=lambda s: s.source_priority)
+        self.max_parallel_sources = (
+            max_parallel_sources
+            if max_parallel_sources is not None
+            else self.MAX_PARALLEL_SOURCES
+        )
         self.deduplicator = CandidateDeduplicator(
             similarity_threshold=similarity_threshold
         )
 
+        # Firecrawl sources share one API key, so concurrent sources must
+        # draw from a single limiter to keep total traffic within its quota
+        firecrawl_sources = [s for s in self.sources if s.uses_firecrawl]
+        if firecrawl_sources and firecrawl_rate_limiter is None:
+            firecrawl_rate_limiter = RateLimiter(
+                requests_per_minute=min(
+                    s.rate_limiter.rpm for s in firecrawl_sources
+                )
+            )
+        self.firecrawl_rate_limiter = firecrawl_rate_limiter
+        for source in firecrawl_sources:
+            source.rate_limiter = firecrawl_rate_limiter
+
         logger.info(
             f"Initialized CandidateAggregator with {len(sources)} sources: "
             f"{[s.source_name for s in self.sources]}"
@@ -148,8 +181,9 @@ class CandidateAggregator:
         """
         Aggregate candidates from all sources.
 
-        Iterates through all sources in priority order, collecting
-        candidates and handling errors gracefully.
+        Queries sources concurrently (bounded by max_parallel_sources),
+        collecting candidates in priority order and handling errors
+        gracefully.
 
         Args:
             chambers: List of chambers to search ("house", "senate").
@@ -158,8 +192,6 @@ class CandidateAggregator:
         Returns:
             AggregationResult with merged candidates and statistics
         """
-        import time
-
         if chambers is None:
             chambers = ["house", "senate"]
 
@@ -171,42 +203,20 @@ class CandidateAggregator:
             f"for chambers: {chambers}"
         )
 
-        # Collect from each source
-        for source in self.sources:
-            source_name = source.source_name
-            start_time = time.time()
-
-            logger.info(f"Discovering candidates from {source_name}...")
-
-            try:
-                candidates = await source.discover_candidates(chambers=chambers)
-                duration = time.time() - start_time
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_sources))
 
-                source_stats[source_name] = SourceResult(
-                    source_name=source_name,
-                    success=True,
-                    candidates=candidates,
-                    duration_seconds=duration,
-                )
-
-                all_candidates.extend(candidates)
-                logger.info(
-                    f"  {source_name}: {len(candidates)} candidates "
-                    f"in {duration:.1f}s"
-                )
-
-            except Exception as e:
-                duration = time.time() - start_time
-                error_msg = str(e)
+        async def discover(source: CandidateSource) -> SourceResult:
+            async with semaphore:
+                return await self._discover_from_source(source, chambers)
 
-                source_stats[source_name] = SourceResult(
-                    source_name=source_name,
-                    success=False,
-                    error=error_msg,
-                    duration_seconds=duration,
-                )
+        # Collect from all sources; gather preserves priority order
+        results = await asyncio.gather(
+            *(discover(source) for source in self.sources)
+        )
 
-                logger.error(f"  {source_name}: FAILED - {error_msg}")
+        for result in results:
+            source_stats[result.source_name] = result
+            all_candidates.extend(result.candidates)
 
         # Deduplicate
         logger.info(
@@ -230,6 +240,55 @@ class CandidateAggregator:
             total_deduplicated=len(merged),
         )
 
+    async def _discover_from_source(
+        self,
+        source: CandidateSource,
+        chambers: list[str],
+    ) -> SourceResult:
+        """
+        Run discovery for a single source, capturing any failure.
+
+        Args:
+            source: Source to discover from
+            chambers: List of chambers to search
+
+        Returns:
+            SourceResult describing the outcome
+        """
+        source_name = source.source_name
+        start_time = time.time()
+
+        logger.info(f"Discovering candidates from {source_name}...")
+
+        try:
+            candidates = await source.discover_candidates(chambers=chambers)
+            duration = time.time() - start_time
+
+            logger.info(
+                f"  {source_name}: {len(candidates)} candidates "
+                f"in {duration:.1f}s"
+            )
+
+            return SourceResult(
+                source_name=source_name,
+                success=True,
+                candidates=candidates,
+                duration_seconds=duration,
+            )
+
+        except Exception as e:
+            duration = time.time() - start_time
+            error_msg = str(e)
+
+            logger.error(f"  {source_name}: FAILED - {error_msg}")
+
+            return SourceResult(
+                source_name=source_name,
+                success=False,
+                error=error_msg,
+                duration_seconds=duration,
+            )
+
     def _find_conflicts(
         self,
         candidates: list[MergedCandidate],
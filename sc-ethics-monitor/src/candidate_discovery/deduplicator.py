@@ -8,11 +8,59 @@ Handles common name variations:
 - Case differences
 """
 
-import re
-from collections import defaultdict
+from array import array
 from typing import Optional
 
-from .sources.base import DiscoveredCandidate, MergedCandidate
+from rapidfuzz.distance import Indel
+
+from .sources.base import (
+    DiscoveredCandidate,
+    MergedCandidate,
+    group_by_district,
+    normalize_name,
+)
+
+
+# Indel similarity is the LCS ratio 2 * LCS / (len(s1) + len(s2)), in native code
+_lcs_ratio = Indel.normalized_similarity
+
+
+def _sort_tokens(name: str) -> str:
+    """Return the words of a name in sorted order."""
+    return " ".join(sorted(name.split()))
+
+
+class _DisjointSet:
+    """
+    Union-find over candidate indices.
+
+    Parent and size links live in contiguous int32 arrays rather than
+    lists of boxed ints.
+    """
+
+    __slots__ = ("parent", "size")
+
+    def __init__(self, n: int):
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+
+    def find(self, x: int) -> int:
+        """Return the root of x, halving the path as it walks."""
+        parent = self.parent
+        while (p := parent[x]) != x:
+            parent[x] = parent[p]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        """Merge the sets containing a and b (union by size)."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
 
 
 class CandidateDeduplicator:
@@ -72,14 +120,10 @@ class CandidateDeduplicator:
         if not candidates:
             return []
 
-        # Group by district
-        by_district: dict[str, list[DiscoveredCandidate]] = defaultdict(list)
-        for candidate in candidates:
-            by_district[candidate.district_id].append(candidate)
-
         merged_candidates = []
 
-        for district_id, district_candidates in by_district.items():
+        # Group by district; candidates in different districts never merge
+        for district_candidates in group_by_district(candidates).values():
             # Cluster by name similarity
             clusters = self._cluster_by_name(district_candidates)
 
@@ -96,8 +140,10 @@ class CandidateDeduplicator:
         """
         Cluster candidates by name similarity.
 
-        Uses a greedy clustering approach where each candidate is either
-        added to an existing cluster or starts a new one.
+        Candidates whose names match are linked in a union-find, so each
+        cluster is a connected component of the name-match graph. Each
+        distinct normalized name is compared once per pair, and pairs
+        already in the same cluster are skipped.
 
         Args:
             candidates: List of candidates within a single district
@@ -108,27 +154,35 @@ class CandidateDeduplicator:
         if not candidates:
             return []
 
-        clusters: list[list[DiscoveredCandidate]] = []
-        used: set[int] = set()
+        # A lone candidate in its district has nothing to compare against
+        if len(candidates) == 1:
+            return [list(candidates)]
 
-        for i, c1 in enumerate(candidates):
-            if i in used:
-                continue
+        sets = _DisjointSet(len(candidates))
 
-            cluster = [c1]
-            used.add(i)
+        # Identical normalized names are unioned directly; only distinct
+        # names (keyed to their first candidate index) are fuzzy-matched
+        name_index: dict[str, int] = {}
+        for i, candidate in enumerate(candidates):
+            first = name_index.setdefault(candidate.normalized_name, i)
+            if first != i:
+                sets.union(first, i)
 
-            for j, c2 in enumerate(candidates[i + 1:], i + 1):
-                if j in used:
+        distinct = list(name_index.items())
+        for a, (name_a, i) in enumerate(distinct):
+            for name_b, j in distinct[a + 1:]:
+                if sets.find(i) == sets.find(j):
                     continue
 
-                if self._names_match(c1.name, c2.name):
-                    cluster.append(c2)
-                    used.add(j)
+                if self._normalized_names_match(name_a, name_b):
+                    sets.union(i, j)
 
-            clusters.append(cluster)
+        # Group by root, ordered by each cluster's first member
+        clusters: dict[int, list[DiscoveredCandidate]] = {}
+        for i, candidate in enumerate(candidates):
+            clusters.setdefault(sets.find(i), []).append(candidate)
 
-        return clusters
+        return list(clusters.values())
 
     def _names_match(self, name1: str, name2: str) -> bool:
         """
@@ -141,10 +195,22 @@ class CandidateDeduplicator:
         Returns:
             True if names match within threshold
         """
-        # Normalize names
-        n1 = self._normalize_name(name1)
-        n2 = self._normalize_name(name2)
+        return self._normalized_names_match(
+            self._normalize_name(name1),
+            self._normalize_name(name2),
+        )
 
+    def _normalized_names_match(self, n1: str, n2: str) -> bool:
+        """
+        Check if two already-normalized names match.
+
+        Args:
+            n1: First normalized name
+            n2: Second normalized name
+
+        Returns:
+            True if names match within threshold
+        """
         # Exact match after normalization
         if n1 == n2:
             return True
@@ -153,20 +219,17 @@ class CandidateDeduplicator:
         if not n1 or not n2:
             return False
 
-        # Fuzzy match
-        similarity = self._calculate_similarity(n1, n2)
+        # Fuzzy match, stopping early once the threshold is out of reach
+        similarity = self._calculate_similarity(
+            n1, n2, score_cutoff=self.similarity_threshold
+        )
         return similarity >= self.similarity_threshold
 
     def _normalize_name(self, name: str) -> str:
         """
         Normalize name for comparison.
 
-        Normalizations:
-        - Lowercase
-        - Remove common suffixes (Jr., Sr., III, etc.)
-        - Remove middle initials
-        - Remove extra whitespace
-        - Remove punctuation
+        See sources.base.normalize_name for the applied normalizations.
 
         Args:
             name: Original name
@@ -174,49 +237,30 @@ class CandidateDeduplicator:
         Returns:
             Normalized name
         """
-        if not name:
-            return ""
-
-        # Lowercase
-        name = name.lower()
-
-        # Remove common suffixes
-        suffixes = [
-            " jr.", " jr", " sr.", " sr",
-            " iii", " ii", " iv", " v",
-            " 3rd", " 2nd", " 4th",
-        ]
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-
-        # Also handle comma-separated suffixes like "Smith, Jr."
-        name = re.sub(r',\s*(jr\.?|sr\.?|iii?|iv|v|2nd|3rd|4th)\s*$', '', name)
-
-        # Remove middle initials (single letter followed by period and space)
-        name = re.sub(r'\b[a-z]\.\s*', '', name)
-
-        # Remove standalone middle initials (single letter between words)
-        name = re.sub(r'\s+[a-z]\s+', ' ', name)
+        return normalize_name(name)
 
-        # Remove common punctuation
-        name = re.sub(r'[.,\'-]', '', name)
-
-        # Remove extra whitespace
-        name = ' '.join(name.split())
-
-        return name.strip()
-
-    def _calculate_similarity(self, s1: str, s2: str) -> float:
+    def _calculate_similarity(
+        self,
+        s1: str,
+        s2: str,
+        score_cutoff: float = 0.0,
+    ) -> float:
         """
         Calculate string similarity using longest common subsequence ratio.
 
         The LCS ratio is calculated as: 2 * LCS_length / (len(s1) + len(s2))
-        This gives a score between 0 and 1, where 1 is identical.
+        This gives a score between 0 and 1, where 1 is identical. Names are
+        also compared with their words sorted, so "smith john" matches
+        "john smith"; the higher of the two scores is returned.
+
+        With a score_cutoff, pairs that cannot reach it return 0.0 early:
+        the LCS is at most the shorter length, so the ratio can never
+        exceed 2 * min(len) / (len(s1) + len(s2)).
 
         Args:
             s1: First string (normalized)
             s2: Second string (normalized)
+            score_cutoff: Scores below this are reported as 0.0
 
         Returns:
             Similarity score between 0 and 1
@@ -228,22 +272,21 @@ class CandidateDeduplicator:
         if s1 == s2:
             return 1.0
 
+        # Length bound (also holds for the word-sorted forms)
         m, n = len(s1), len(s2)
+        if (2 * min(m, n)) / (m + n) < score_cutoff:
+            return 0.0
 
-        # DP table for LCS
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+        similarity = _lcs_ratio(s1, s2, score_cutoff=score_cutoff)
 
-        lcs_length = dp[m][n]
+        sorted1, sorted2 = _sort_tokens(s1), _sort_tokens(s2)
+        if sorted1 != s1 or sorted2 != s2:
+            similarity = max(
+                similarity,
+                _lcs_ratio(sorted1, sorted2, score_cutoff=score_cutoff),
+            )
 
-        # LCS ratio
-        return (2 * lcs_length) / (m + n)
+        return similarity
 
     def _merge_cluster(
         self,
@@ -265,26 +308,27 @@ class CandidateDeduplicator:
         Returns:
             Merged candidate record
         """
-        # Sort by source priority
-        cluster.sort(key=lambda c: self._get_source_priority(c.source))
+        # Sort once by source priority; every selection below is then a
+        # first-match scan over the sorted cluster
+        priorities = self.SOURCE_PRIORITIES
+        cluster.sort(key=lambda c: priorities.get(c.source, 10))
 
         primary = cluster[0]
 
-        # Collect all sources and URLs
-        sources = list(set(c.source for c in cluster if c.source))
+        # Collect all sources (in priority order) and URLs
+        sources = list(dict.fromkeys(c.source for c in cluster if c.source))
         source_urls = {c.source: c.source_url for c in cluster if c.source_url}
 
         # Determine best party (from highest priority source with party)
-        party = None
-        party_confidence = "UNKNOWN"
-        party_source = None
-
-        for c in cluster:
-            if c.party:
-                party = c.party
-                party_confidence = c.party_confidence
-                party_source = c.source
-                break
+        party_record = next((c for c in cluster if c.party), None)
+        if party_record is not None:
+            party = party_record.party
+            party_confidence = party_record.party_confidence
+            party_source = party_record.source
+        else:
+            party = None
+            party_confidence = "UNKNOWN"
+            party_source = None
 
         # Determine incumbent status (any source saying incumbent)
         is_incumbent = any(c.incumbent for c in cluster)
@@ -378,9 +422,11 @@ class CandidateDeduplicator:
             for c2 in candidates[i + 1:]:
                 if c1.district_id != c2.district_id:
                     # Cross-district potential duplicate
-                    n1 = self._normalize_name(c1.name)
-                    n2 = self._normalize_name(c2.name)
-                    similarity = self._calculate_similarity(n1, n2)
+                    similarity = self._calculate_similarity(
+                        c1.normalized_name,
+                        c2.normalized_name,
+                        score_cutoff=threshold,
+                    )
 
                     if similarity >= threshold:
                         duplicates.append((c1, c2, similarity))
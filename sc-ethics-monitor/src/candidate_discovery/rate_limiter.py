@@ -39,6 +39,7 @@ class RateLimiter:
         self._last_request: float = 0.0
         self._request_count: int = 0
         self._window_start: float = time.time()
+        self._lock = asyncio.Lock()
 
     async def wait(self) -> None:
         """
@@ -48,29 +49,32 @@ class RateLimiter:
         It will sleep if the time since the last request is less
         than the required interval.
         """
-        now = time.time()
-
-        # Check if we need to reset the window
-        if now - self._window_start >= 60.0:
-            self._window_start = now
-            self._request_count = 0
-
-        # Check if we're at the rate limit
-        if self._request_count >= self.rpm:
-            # Wait until the window resets
-            sleep_time = 60.0 - (now - self._window_start)
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-            self._window_start = time.time()
-            self._request_count = 0
-
-        # Ensure minimum interval between requests
-        elapsed = now - self._last_request
-        if elapsed < self.interval:
-            await asyncio.sleep(self.interval - elapsed)
-
-        self._last_request = time.time()
-        self._request_count += 1
+        # Serialize callers so sources sharing this limiter cannot
+        # all pass the interval check at the same instant
+        async with self._lock:
+            now = time.time()
+
+            # Check if we need to reset the window
+            if now - self._window_start >= 60.0:
+                self._window_start = now
+                self._request_count = 0
+
+            # Check if we're at the rate limit
+            if self._request_count >= self.rpm:
+                # Wait until the window resets
+                sleep_time = 60.0 - (now - self._window_start)
+                if sleep_time > 0:
+                    await asyncio.sleep(sleep_time)
+                self._window_start = time.time()
+                self._request_count = 0
+
+            # Ensure minimum interval between requests
+            elapsed = now - self._last_request
+            if elapsed < self.interval:
+                await asyncio.sleep(self.interval - elapsed)
+
+            self._last_request = time.time()
+            self._request_count += 1
 
     def wait_sync(self) -> None:
         """
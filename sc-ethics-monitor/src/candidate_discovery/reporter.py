@@ -12,8 +12,11 @@ Used to track discovery effectiveness and identify gaps.
 """
 
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 
 from .aggregator import AggregationResult
@@ -21,6 +24,9 @@ from .sources.base import MergedCandidate
 
 logger = logging.getLogger(__name__)
 
+_get_district_id = attrgetter("district_id")
+_get_party = attrgetter("party")
+
 
 # Import config for district counts
 try:
@@ -31,6 +37,38 @@ except ImportError:
     SC_SENATE_DISTRICTS = int(os.environ.get("SC_SENATE_DISTRICTS", "46"))
 
 
+@lru_cache(maxsize=16)
+def _all_district_ids(
+    house_districts: int,
+    senate_districts: int,
+    chambers: tuple[str, ...],
+) -> frozenset[str]:
+    """
+    Build the set of every district ID tracked for the given chambers.
+
+    Cached because the district universe only changes with configuration,
+    while reports are generated on every discovery run.
+
+    Args:
+        house_districts: Number of House districts
+        senate_districts: Number of Senate districts
+        chambers: Chambers being analyzed
+
+    Returns:
+        Frozen set of district IDs like "SC-House-001"
+    """
+    district_ids: set[str] = set()
+    if "house" in chambers:
+        district_ids.update(
+            f"SC-House-{i:03d}" for i in range(1, house_districts + 1)
+        )
+    if "senate" in chambers:
+        district_ids.update(
+            f"SC-Senate-{i:03d}" for i in range(1, senate_districts + 1)
+        )
+    return frozenset(district_ids)
+
+
 @dataclass
 class CoverageReport:
     """
@@ -163,8 +201,8 @@ class CoverageReporter:
         if "senate" in chambers:
             total += self.senate_districts
 
-        # Calculate districts with candidates
-        districts_with = self._get_districts_with_candidates(
+        # Districts with candidates and party counts, in one pass
+        districts_with, by_party = self._tally_candidates(
             aggregation_result.candidates
         )
 
@@ -173,9 +211,6 @@ class CoverageReporter:
             districts_with, chambers
         )
 
-        # Count candidates by party
-        by_party = self._count_by_party(aggregation_result.candidates)
-
         # Count candidates by source
         by_source = self._count_by_source(aggregation_result)
 
@@ -199,20 +234,26 @@ class CoverageReporter:
 
         return report
 
-    def _get_districts_with_candidates(
+    def _tally_candidates(
         self,
         candidates: list[MergedCandidate],
-    ) -> set[str]:
+    ) -> tuple[set[str], dict[Optional[str], int]]:
         """
-        Get set of district IDs that have at least one candidate.
+        Collect covered districts and party counts.
+
+        Both tallies are driven by C-level iteration (set/Counter over
+        attrgetter maps) rather than a per-candidate Python loop.
 
         Args:
             candidates: List of merged candidates
 
         Returns:
-            Set of district IDs with candidates
+            Tuple of (set of district IDs with candidates,
+            dict mapping party code (may be None) to count)
         """
-        return {c.district_id for c in candidates}
+        districts = set(map(_get_district_id, candidates))
+        party_counts = Counter(map(_get_party, candidates))
+        return districts, dict(party_counts)
 
     def _get_districts_without_candidates(
         self,
@@ -229,37 +270,10 @@ class CoverageReporter:
         Returns:
             Sorted list of district IDs without candidates
         """
-        all_districts = set()
-
-        for chamber in chambers:
-            if chamber == "house":
-                for i in range(1, self.house_districts + 1):
-                    all_districts.add(f"SC-House-{i:03d}")
-            elif chamber == "senate":
-                for i in range(1, self.senate_districts + 1):
-                    all_districts.add(f"SC-Senate-{i:03d}")
-
-        without = all_districts - districts_with
-        return sorted(list(without))
-
-    def _count_by_party(
-        self,
-        candidates: list[MergedCandidate],
-    ) -> dict[str, int]:
-        """
-        Count candidates by party.
-
-        Args:
-            candidates: List of merged candidates
-
-        Returns:
-            Dict mapping party code to count
-        """
-        counts = {}
-        for candidate in candidates:
-            party = candidate.party  # May be None
-            counts[party] = counts.get(party, 0) + 1
-        return counts
+        all_districts = _all_district_ids(
+            self.house_districts, self.senate_districts, tuple(chambers)
+        )
+        return sorted(all_districts - districts_with)
 
     def _count_by_source(
         self,
@@ -385,7 +399,7 @@ def format_email_section(
     else:
         coverage_color = "#ef4444"  # Red
 
-    html = f"""
+    parts = [f"""
     <div style="border: 1px solid #e5e7eb; border-radius: 8px; padding: 16px; margin: 16px 0;">
         <h3 style="margin: 0 0 12px 0; color: #374151;">Candidate Discovery Report</h3>
 
@@ -409,10 +423,10 @@ def format_email_section(
                     +{report.new_candidates_this_run} new, +{report.updated_candidates_this_run} updated
                 </div>
             </div>
-    """
+    """]
 
     if report.conflicts_found > 0:
-        html += f"""
+        parts.append(f"""
             <div style="flex: 1; min-width: 150px;">
                 <div style="font-size: 12px; color: #6b7280; text-transform: uppercase;">Conflicts</div>
                 <div style="font-size: 24px; font-weight: bold; color: #f59e0b;">
@@ -422,19 +436,19 @@ def format_email_section(
                     Require review
                 </div>
             </div>
-        """
+        """)
 
-    html += """
+    parts.append("""
         </div>
-    """
+    """)
 
     # Party breakdown
     if report.candidates_by_party:
-        html += """
+        parts.append("""
         <div style="margin-bottom: 12px;">
             <div style="font-size: 12px; color: #6b7280; margin-bottom: 4px;">By Party</div>
             <div style="display: flex; gap: 12px; flex-wrap: wrap;">
-        """
+        """)
         party_colors = {
             "D": ("#dbeafe", "#1d4ed8"),  # Blue
             "R": ("#fee2e2", "#b91c1c"),  # Red
@@ -448,55 +462,55 @@ def format_email_section(
             if count > 0:
                 bg, text = party_colors.get(party, ("#f3f4f6", "#6b7280"))
                 label = party_labels.get(party, "Unknown")
-                html += f"""
+                parts.append(f"""
                 <span style="background: {bg}; color: {text}; padding: 4px 8px; border-radius: 4px; font-size: 12px;">
                     {label}: {count}
                 </span>
-                """
+                """)
 
-        html += """
+        parts.append("""
             </div>
         </div>
-        """
+        """)
 
     # Source breakdown
     if report.candidates_by_source:
-        html += """
+        parts.append("""
         <div style="margin-bottom: 12px;">
             <div style="font-size: 12px; color: #6b7280; margin-bottom: 4px;">By Source</div>
             <div style="font-size: 13px; color: #374151;">
-        """
+        """)
         source_parts = [f"{src}: {count}" for src, count in sorted(report.candidates_by_source.items())]
-        html += " | ".join(source_parts)
-        html += """
+        parts.append(" | ".join(source_parts))
+        parts.append("""
             </div>
         </div>
-        """
+        """)
 
     # Districts without candidates
     if report.districts_without_candidates and show_districts_without > 0:
-        html += f"""
+        parts.append(f"""
         <div>
             <div style="font-size: 12px; color: #6b7280; margin-bottom: 4px;">
                 Districts Without Candidates ({len(report.districts_without_candidates)})
             </div>
             <div style="font-size: 12px; color: #9ca3af;">
-        """
+        """)
         display_districts = report.districts_without_candidates[:show_districts_without]
-        html += ", ".join(display_districts)
+        parts.append(", ".join(display_districts))
         if len(report.districts_without_candidates) > show_districts_without:
             remaining = len(report.districts_without_candidates) - show_districts_without
-            html += f" ... +{remaining} more"
-        html += """
+            parts.append(f" ... +{remaining} more")
+        parts.append("""
             </div>
         </div>
-        """
+        """)
 
-    html += """
+    parts.append("""
     </div>
-    """
+    """)
 
-    return html
+    return "".join(parts)
 
 
 def format_summary_line(report: CoverageReport) -> str:
@@ -13,6 +13,7 @@ District counts:
 - SC Senate: 46 districts
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime, timezone
@@ -22,7 +23,7 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..rate_limiter import RateLimiter
-from .base import CandidateSource, DiscoveredCandidate
+from .base import CandidateSource, DiscoveredCandidate, district_id_from_parts
 
 # Import config - handle both direct import and package import
 try:
@@ -109,6 +110,11 @@ class BallotpediaSource(CandidateSource):
         """Return the source priority (2 = comprehensive)."""
         return 2
 
+    @property
+    def uses_firecrawl(self) -> bool:
+        """Return True; pages are scraped through Firecrawl."""
+        return True
+
     def __init__(
         self,
         firecrawl_api_key: Optional[str] = None,
@@ -168,8 +174,7 @@ class BallotpediaSource(CandidateSource):
         Returns:
             District ID (e.g., "SC-House-042")
         """
-        chamber_title = chamber.title()  # "house" -> "House"
-        return f"SC-{chamber_title}-{district_num:03d}"
+        return district_id_from_parts(chamber, district_num)
 
     def _normalize_party(self, party_text: str) -> Optional[str]:
         """
@@ -242,7 +247,11 @@ class BallotpediaSource(CandidateSource):
             }
 
             logger.debug(f"Scraping {url} for {district_id}")
-            response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            # Run the blocking request off the event loop so sources
+            # aggregated concurrently can overlap their network waits
+            response = await asyncio.to_thread(
+                requests.post, api_url, headers=headers, json=payload, timeout=30
+            )
 
             if response.status_code == 200:
                 data = response.json()
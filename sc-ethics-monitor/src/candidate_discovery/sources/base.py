@@ -2,19 +2,87 @@
 Base classes and dataclasses for candidate discovery sources.
 
 Defines:
+- normalize_name: Shared name normalization for matching
+- group_by_district: Index candidates by district_id
+- district_id_from_parts: Build a district_id from chamber and number
 - DiscoveredCandidate: A candidate discovered from an external source
 - MergedCandidate: A candidate merged from multiple sources
 - ConflictRecord: Tracks conflicts between sources
 - CandidateSource: Abstract base class for source adapters
 """
 
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+# Name normalization patterns, compiled once
+_NAME_SUFFIXES = (
+    " jr.", " jr", " sr.", " sr",
+    " iii", " ii", " iv", " v",
+    " 3rd", " 2nd", " 4th",
+)
+_COMMA_SUFFIX_RE = re.compile(r',\s*(jr\.?|sr\.?|iii?|iv|v|2nd|3rd|4th)\s*$')
+_DOTTED_INITIAL_RE = re.compile(r'\b[a-z]\.\s*')
+_STANDALONE_INITIAL_RE = re.compile(r'\s+[a-z]\s+')
+_NAME_PUNCTUATION_RE = re.compile(r"[.,'-]")
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Normalize a candidate name for comparison.
+
+    Normalizations:
+    - Lowercase
+    - Remove common suffixes (Jr., Sr., III, etc.)
+    - Remove middle initials
+    - Remove extra whitespace
+    - Remove punctuation
+
+    Results are cached, since the same names recur across sources.
+
+    Args:
+        name: Original name
+
+    Returns:
+        Normalized name
+    """
+    if not name:
+        return ""
+
+    # Lowercase
+    name = name.lower()
+
+    # Remove common suffixes
+    for suffix in _NAME_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+
+    # Also handle comma-separated suffixes like "Smith, Jr."
+    name = _COMMA_SUFFIX_RE.sub('', name)
+
+    # Remove middle initials (single letter followed by period and space)
+    name = _DOTTED_INITIAL_RE.sub('', name)
+
+    # Remove standalone middle initials (single letter between words)
+    name = _STANDALONE_INITIAL_RE.sub(' ', name)
+
+    # Remove common punctuation
+    name = _NAME_PUNCTUATION_RE.sub('', name)
+
+    # Remove extra whitespace
+    name = ' '.join(name.split())
+
+    return name.strip()
+
+
+@dataclass(slots=True, frozen=True)
 class DiscoveredCandidate:
     """
     A candidate discovered from an external source.
@@ -30,6 +98,7 @@ class DiscoveredCandidate:
         discovered_date: ISO timestamp when discovered
         incumbent: Whether candidate is the incumbent
         additional_data: Extra source-specific data
+        normalized_name: Name normalized for matching (computed once)
     """
     name: str
     district_id: str
@@ -43,33 +112,94 @@ class DiscoveredCandidate:
     )
     incumbent: bool = False
     additional_data: dict = field(default_factory=dict)
+    normalized_name: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate and normalize fields after initialization."""
+        # Instances are frozen, so normalized values bypass __setattr__
+        set_field = object.__setattr__
+
+        # Intern the small, heavily repeated keys used for grouping so
+        # district/source comparisons hit the identity fast path
+        set_field(self, "district_id", sys.intern(self.district_id))
+        set_field(self, "source", sys.intern(self.source))
+
         # Normalize party to uppercase single letter
-        if self.party:
-            self.party = self.party.upper()
-            if self.party not in ("D", "R", "I", "O"):
+        party = self.party
+        if party:
+            party = party.upper()
+            if party not in ("D", "R", "I", "O"):
                 # Try to extract from full name
-                party_lower = self.party.lower()
+                party_lower = party.lower()
                 if "democrat" in party_lower:
-                    self.party = "D"
+                    party = "D"
                 elif "republican" in party_lower:
-                    self.party = "R"
+                    party = "R"
                 elif "independent" in party_lower:
-                    self.party = "I"
+                    party = "I"
                 else:
-                    self.party = "O"
+                    party = "O"
+            set_field(self, "party", party)
 
         # Normalize confidence
         valid_confidences = {"HIGH", "MEDIUM", "LOW", "UNKNOWN"}
-        if self.party_confidence.upper() not in valid_confidences:
-            self.party_confidence = "UNKNOWN"
-        else:
-            self.party_confidence = self.party_confidence.upper()
+        confidence = self.party_confidence.upper()
+        if confidence not in valid_confidences:
+            confidence = "UNKNOWN"
+        set_field(self, "party_confidence", confidence)
 
+        # Normalize name once so deduplication never re-normalizes
+        set_field(self, "normalized_name", normalize_name(self.name))
 
-@dataclass
+
+def group_by_district(candidates: list) -> dict[str, list]:
+    """
+    Group candidates by district_id in a single pass.
+
+    Sources use this to answer per-district lookups with a dict access
+    instead of scanning every candidate.
+
+    Args:
+        candidates: Candidates with a district_id attribute
+
+    Returns:
+        Dict mapping district_id to candidates, in input order
+    """
+    by_district: dict[str, list] = defaultdict(list)
+    for candidate in candidates:
+        by_district[candidate.district_id].append(candidate)
+    return dict(by_district)
+
+
+# Every SC legislative seat's district_id, built once at import
+_DISTRICT_IDS = {
+    (chamber, district_num): f"SC-{chamber.title()}-{district_num:03d}"
+    for chamber, seats in (("house", 124), ("senate", 46))
+    for district_num in range(1, seats + 1)
+}
+
+
+def district_id_from_parts(chamber: str, district_num: int) -> str:
+    """
+    Create district_id from chamber and number.
+
+    Known seats are served from a precomputed table; anything else is
+    formatted on the fly.
+
+    Args:
+        chamber: "house" or "senate"
+        district_num: District number
+
+    Returns:
+        District ID (e.g., "SC-House-042")
+    """
+    district_id = _DISTRICT_IDS.get((chamber, district_num))
+    if district_id is None:
+        district_id = f"SC-{chamber.title()}-{district_num:03d}"
+    return district_id
+
+
+@dataclass(slots=True, frozen=True)
 class MergedCandidate:
     """
     A candidate merged from multiple discovery sources.
@@ -189,6 +319,20 @@ class CandidateSource(ABC):
         """
         pass
 
+    @property
+    def uses_firecrawl(self) -> bool:
+        """
+        Whether this source scrapes through the Firecrawl API.
+
+        Firecrawl-backed sources expose a ``rate_limiter`` attribute that
+        the aggregator replaces with one limiter shared across them, since
+        they all draw on the same API key's quota.
+
+        Returns:
+            True if the source calls Firecrawl, False otherwise.
+        """
+        return False
+
     @abstractmethod
     async def discover_candidates(
         self,
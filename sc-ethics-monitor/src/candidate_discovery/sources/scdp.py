@@ -13,6 +13,7 @@ This source primarily tracks current elected officials (incumbents) and
 endorsed candidates when announced.
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime, timezone
@@ -22,7 +23,12 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..rate_limiter import RateLimiter
-from .base import CandidateSource, DiscoveredCandidate
+from .base import (
+    CandidateSource,
+    DiscoveredCandidate,
+    district_id_from_parts,
+    group_by_district,
+)
 
 # Import config - handle both direct import and package import
 try:
@@ -83,6 +89,13 @@ class SCDPSource(CandidateSource):
         re.IGNORECASE
     )
 
+    # Both chambers fused so text is scanned once; group names tell them apart
+    DISTRICT_PATTERN = re.compile(
+        r"(?:Senate|SD|State\s*Senate|Senate\s+District)\s*(?:#?\s*)?(?P<senate_num>\d{1,2})"
+        r"|(?:House|HD|House\s+District)\s*(?:#?\s*)?(?P<house_num>\d{1,3})",
+        re.IGNORECASE
+    )
+
     # Name extraction patterns
     # Pattern: **Name** or ### Name or - Name
     NAME_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
@@ -95,6 +108,31 @@ class SCDPSource(CandidateSource):
         re.IGNORECASE
     )
 
+    # Bold name followed by a district reference: "**John Smith** - District 42"
+    BOLD_DISTRICT_PATTERN = re.compile(
+        r"\*\*([^*]+)\*\*[^*]*?(?:District|Dist\.?)\s*(\d{1,3})",
+        re.IGNORECASE
+    )
+
+    # Name at line start followed by a district marker: "- Name - District"
+    NAME_DISTRICT_PATTERN = re.compile(
+        r"^[-*]?\s*([A-Z][a-zA-Z\.\s]+?)(?:\s*[-\u2013\u2014]\s*(?:District|Dist|HD|SD))",
+        re.IGNORECASE
+    )
+
+    # Substrings that mark a string as something other than a person's name
+    NON_NAME_PATTERN = re.compile(
+        r"district|house|senate|state|county|election|vote|democratic|"
+        r"republican|congress|president|contact|office",
+        re.IGNORECASE
+    )
+
+    # Navigation, footer and fundraising lines that never list candidates
+    SKIP_LINE_PATTERN = re.compile(
+        r"donate|volunteer|contact|subscribe|privacy|copyright|navigation",
+        re.IGNORECASE
+    )
+
     @property
     def source_name(self) -> str:
         """Return the source identifier."""
@@ -105,6 +143,11 @@ class SCDPSource(CandidateSource):
         """Return the source priority (3 = party-specific)."""
         return 3
 
+    @property
+    def uses_firecrawl(self) -> bool:
+        """Return True; pages are scraped through Firecrawl."""
+        return True
+
     def __init__(
         self,
         firecrawl_api_key: Optional[str] = None,
@@ -130,8 +173,8 @@ class SCDPSource(CandidateSource):
         # Cache for scraped pages (url -> markdown)
         self._page_cache: dict[str, str] = {}
 
-        # Cache for discovered candidates
-        self._candidates_cache: list[DiscoveredCandidate] = []
+        # Cache for discovered candidates (district_id -> candidates)
+        self._candidates_cache: dict[str, list[DiscoveredCandidate]] = {}
 
     def _district_id_from_parts(self, chamber: str, district_num: int) -> str:
         """
@@ -144,8 +187,7 @@ class SCDPSource(CandidateSource):
         Returns:
             District ID (e.g., "SC-House-042")
         """
-        chamber_title = chamber.title()
-        return f"SC-{chamber_title}-{district_num:03d}"
+        return district_id_from_parts(chamber, district_num)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -187,7 +229,11 @@ class SCDPSource(CandidateSource):
             }
 
             logger.debug(f"Scraping {url}")
-            response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            # Run the blocking request off the event loop so sources
+            # aggregated concurrently can overlap their network waits
+            response = await asyncio.to_thread(
+                requests.post, api_url, headers=headers, json=payload, timeout=30
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -226,19 +272,27 @@ class SCDPSource(CandidateSource):
         Returns:
             Tuple of (chamber, district_num) or (None, None)
         """
-        # Check for Senate district first (more specific pattern)
-        senate_match = self.SENATE_DISTRICT_PATTERN.search(text)
-        if senate_match:
-            district_num = int(senate_match.group(1))
+        # The first Senate reference takes precedence over any House one
+        house_num = None
+        for match in self.DISTRICT_PATTERN.finditer(text):
+            if match.group("senate_num") is None:
+                if house_num is None:
+                    house_num = int(match.group("house_num"))
+                continue
+
+            district_num = int(match.group("senate_num"))
             if 1 <= district_num <= SC_SENATE_DISTRICTS:
                 return "senate", district_num
 
-        # Check for House district
-        house_match = self.HOUSE_DISTRICT_PATTERN.search(text)
-        if house_match:
-            district_num = int(house_match.group(1))
-            if 1 <= district_num <= SC_HOUSE_DISTRICTS:
-                return "house", district_num
+            # An out-of-range Senate hit may have consumed a House reference
+            if house_num is None:
+                house_match = self.HOUSE_DISTRICT_PATTERN.search(text)
+                if house_match:
+                    house_num = int(house_match.group(1))
+            break
+
+        if house_num is not None and 1 <= house_num <= SC_HOUSE_DISTRICTS:
+            return "house", house_num
 
         return None, None
 
@@ -268,11 +322,13 @@ class SCDPSource(CandidateSource):
         if not markdown:
             return candidates
 
+        # Every candidate on one page shares the same discovery moment
+        discovered_date = datetime.now(timezone.utc).isoformat()
+
         # Strategy 1: Look for "Name - District X" patterns
-        lines = markdown.split("\n")
         current_section = ""
 
-        for i, line in enumerate(lines):
+        for line in markdown.split("\n"):
             line = line.strip()
             if not line:
                 continue
@@ -283,10 +339,7 @@ class SCDPSource(CandidateSource):
                 continue
 
             # Skip navigation, footer, etc.
-            if any(skip in line.lower() for skip in [
-                "donate", "volunteer", "contact", "subscribe",
-                "privacy", "copyright", "navigation"
-            ]):
+            if self.SKIP_LINE_PATTERN.search(line):
                 continue
 
             # Look for district context in this line
@@ -295,9 +348,9 @@ class SCDPSource(CandidateSource):
             if chamber and district_num:
                 # Find name in this line or nearby lines
                 names = self._extract_names_from_line(line)
+                district_id = self._district_id_from_parts(chamber, district_num)
 
                 for name in names:
-                    district_id = self._district_id_from_parts(chamber, district_num)
                     key = (name.lower(), district_id)
 
                     if key in seen:
@@ -318,6 +371,7 @@ class SCDPSource(CandidateSource):
                         party_confidence="HIGH",
                         source=self.source_name,
                         source_url=source_url,
+                        discovered_date=discovered_date,
                         filing_status="declared" if not is_incumbent else None,
                         incumbent=is_incumbent,
                         additional_data={
@@ -330,21 +384,17 @@ class SCDPSource(CandidateSource):
 
         # Strategy 2: Parse bold names with district context
         # Look for patterns like "**John Smith** - District 42"
-        bold_pattern = re.compile(
-            r"\*\*([^*]+)\*\*[^*]*?(?:District|Dist\.?)\s*(\d{1,3})",
-            re.IGNORECASE
-        )
-        for match in bold_pattern.finditer(markdown):
+        for match in self.BOLD_DISTRICT_PATTERN.finditer(markdown):
             name = match.group(1).strip()
             district_num = int(match.group(2))
 
             # Determine chamber from context
             context_start = max(0, match.start() - 200)
-            context = markdown[context_start:match.end()]
+            context = markdown[context_start:match.end()].lower()
 
-            if "senate" in context.lower():
+            if "senate" in context:
                 chamber = "senate"
-            elif "house" in context.lower():
+            elif "house" in context:
                 chamber = "house"
             else:
                 # Default to house if district number is in range
@@ -367,6 +417,7 @@ class SCDPSource(CandidateSource):
                 party_confidence="HIGH",
                 source=self.source_name,
                 source_url=source_url,
+                discovered_date=discovered_date,
                 filing_status="declared",
                 incumbent=False,
             )
@@ -397,11 +448,7 @@ class SCDPSource(CandidateSource):
         # If no bold names, try to extract from line start
         if not names:
             # Pattern: "- Name - District" or "Name - District"
-            name_district_pattern = re.compile(
-                r"^[-*]?\s*([A-Z][a-zA-Z\.\s]+?)(?:\s*[-\u2013\u2014]\s*(?:District|Dist|HD|SD))",
-                re.IGNORECASE
-            )
-            match = name_district_pattern.match(line)
+            match = self.NAME_DISTRICT_PATTERN.match(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name):
@@ -422,16 +469,6 @@ class SCDPSource(CandidateSource):
         if not name or len(name) < 3:
             return False
 
-        # Skip obvious non-names
-        skip_words = [
-            "district", "house", "senate", "state", "county",
-            "election", "vote", "democratic", "republican",
-            "congress", "president", "contact", "office"
-        ]
-        name_lower = name.lower()
-        if any(word in name_lower for word in skip_words):
-            return False
-
         # Should have at least two words (first and last name)
         parts = name.split()
         if len(parts) < 2:
@@ -441,7 +478,8 @@ class SCDPSource(CandidateSource):
         if not parts[0][0].isupper():
             return False
 
-        return True
+        # Skip obvious non-names; checked last as it scans the whole string
+        return self.NON_NAME_PATTERN.search(name) is None
 
     async def discover_candidates(
         self,
@@ -495,7 +533,7 @@ class SCDPSource(CandidateSource):
                 seen.add(key)
                 unique_candidates.append(c)
 
-        self._candidates_cache = unique_candidates
+        self._candidates_cache = group_by_district(unique_candidates)
         logger.info(f"SCDP discovery complete: {len(unique_candidates)} candidates")
         return unique_candidates
 
@@ -514,10 +552,7 @@ class SCDPSource(CandidateSource):
         Returns:
             List of candidates for that district
         """
-        return [
-            c for c in self._candidates_cache
-            if c.district_id == district_id
-        ]
+        return list(self._candidates_cache.get(district_id, ()))
 
     async def extract_district_candidates_async(
         self,
@@ -554,5 +589,7 @@ class SCDPSource(CandidateSource):
         """
         return {
             "pages_cached": len(self._page_cache),
-            "candidates_cached": len(self._candidates_cache),
+            "candidates_cached": sum(
+                len(c) for c in self._candidates_cache.values()
+            ),
         }
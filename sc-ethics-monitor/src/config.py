@@ -131,7 +131,7 @@ SOT_STATIC_DROPDOWNS = {
 }
 
 # Columns that automation should NEVER write to
-PROTECTED_COLUMNS = ["bench_potential"]
+PROTECTED_COLUMNS = frozenset({"bench_potential"})
 
 # Headers for dynamic columns (M through AF, starting at index 12)
 SOURCE_OF_TRUTH_HEADERS_DYNAMIC = [
@@ -176,6 +176,24 @@ SOURCE_OF_TRUTH_COL_LETTERS = {
     "last_updated": "AF",
 }
 
+# Column letters for 0-based indices A..ZZ, built once for O(1) lookups
+_LETTERS = [chr(ord("A") + i) for i in range(26)]
+COLUMN_LETTERS = tuple(_LETTERS + [a + b for a in _LETTERS for b in _LETTERS])
+
+
+def col_letter(col_index: int) -> str:
+    """Convert 0-based column index to letter (0 -> A, 26 -> AA, 31 -> AF)."""
+    if col_index < len(COLUMN_LETTERS):
+        return COLUMN_LETTERS[col_index]
+    # Past ZZ: fall back to bijective base-26
+    result = ""
+    col_index += 1
+    while col_index > 0:
+        col_index, remainder = divmod(col_index - 1, 26)
+        result = chr(65 + remainder) + result
+    return result
+
+
 # Number of days for "NEW" candidate highlighting
 NEW_CANDIDATE_DAYS = 7
 
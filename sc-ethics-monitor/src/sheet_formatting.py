@@ -49,6 +49,7 @@ from .config import (
     PRIORITY_TIERS,
     FILTER_VIEWS,
     COLUMN_WIDTHS,
+    col_letter,
 )
 
 
@@ -921,12 +922,7 @@ class SheetFormatter:
 
     def _col_letter(self, col_index: int) -> str:
         """Convert 0-based column index to letter (handles multi-letter columns)."""
-        result = ""
-        col_index += 1  # Convert to 1-based
-        while col_index > 0:
-            col_index, remainder = divmod(col_index - 1, 26)
-            result = chr(65 + remainder) + result
-        return result
+        return col_letter(col_index)
 
     def clear_conditional_formatting(self, worksheet: gspread.Worksheet) -> None:
         """
@@ -57,9 +57,16 @@ from .config import (
     GOOGLE_SHEETS_CREDENTIALS,
     SC_HOUSE_DISTRICTS,
     SC_SENATE_DISTRICTS,
+    col_letter,
 )
 
 
+# Source of Truth dynamic columns N-AF (indices 13-31), as written by
+# _build_sot_row_data: P-S, U-X and Z-AC start at these row offsets
+_SOT_ROW_WIDTH = 19
+_SOT_CHALLENGER_OFFSETS = (2, 7, 12)
+
+
 class SheetsSync:
     """
     Simplified sync manager for Google Sheets.
@@ -143,7 +150,7 @@ class SheetsSync:
 
     def _col_letter(self, col_index: int) -> str:
         """Convert 0-based column index to letter (0 -> A, 1 -> B, etc)."""
-        return chr(ord('A') + col_index)
+        return col_letter(col_index)
 
     # =========================================================================
     # Read Sheet State
@@ -783,18 +790,14 @@ class SheetsSync:
             return "D - Covered"
 
         # A - Flip Target: R incumbent, no D filed
-        if incumbent_party == "R" and dem_count == 0:
+        if incumbent_party == "R":
             return "A - Flip Target"
 
         # B - Defend: D incumbent, no D filed yet (may need replacement)
-        if incumbent_party == "D" and dem_count == 0:
+        if incumbent_party == "D":
             return "B - Defend"
 
-        # C - Competitive: Multiple challengers but no clear picture
-        if challenger_count >= 2:
-            return "C - Competitive"
-
-        # Default - Open seat or unclear
+        # C - Competitive: open seat or unclear, however many challengers
         return "C - Competitive"
 
     def _sort_candidates(self, candidates: list) -> list:
@@ -827,43 +830,22 @@ class SheetsSync:
         Returns a list of values for columns N through AF (indices 13-31),
         with spacer columns as empty strings.
         """
-        def cand_values(c):
-            if c is None:
-                return ["", "", "", ""]
-            return [
-                c.get("name", ""),
-                c.get("party", "?"),
-                c.get("filed_date", ""),
-                c.get("ethics_url", ""),
-            ]
-
-        c1 = cand_values(cand1)
-        c2 = cand_values(cand2)
-        c3 = cand_values(cand3)
-
         # Build row: N through AF
         # N=dem_filed, O=spacer, P-S=cand1, T=spacer, U-X=cand2, Y=spacer, Z-AC=cand3, AD=spacer, AE=skip(protected), AF=last_updated
-        return [
-            dem_filed,       # N (13) - Dem Filed
-            "",              # O (14) - spacer
-            c1[0],           # P (15) - Challenger 1 name
-            c1[1],           # Q (16) - Party
-            c1[2],           # R (17) - Filed Date
-            c1[3],           # S (18) - Ethics URL
-            "",              # T (19) - spacer
-            c2[0],           # U (20) - Challenger 2 name
-            c2[1],           # V (21) - Party
-            c2[2],           # W (22) - Filed Date
-            c2[3],           # X (23) - Ethics URL
-            "",              # Y (24) - spacer
-            c3[0],           # Z (25) - Challenger 3 name
-            c3[1],           # AA (26) - Party
-            c3[2],           # AB (27) - Filed Date
-            c3[3],           # AC (28) - Ethics URL
-            "",              # AD (29) - spacer
-            "",              # AE (30) - Bench/Potential (SKIP - protected)
-            last_updated,    # AF (31) - Last Updated
-        ]
+        # Spacers, empty challenger slots and AE (protected) stay ""
+        row = [""] * _SOT_ROW_WIDTH
+        row[0] = dem_filed        # N (13) - Dem Filed
+        for offset, c in zip(_SOT_CHALLENGER_OFFSETS, (cand1, cand2, cand3)):
+            if c is not None:
+                # Name, Party, Filed Date, Ethics URL
+                row[offset:offset + 4] = (
+                    c.get("name", ""),
+                    c.get("party", "?"),
+                    c.get("filed_date", ""),
+                    c.get("ethics_url", ""),
+                )
+        row[-1] = last_updated    # AF (31) - Last Updated
+        return row
 
     @sheets_retry()
     def sync_to_source_of_truth(self, candidates: dict = None) -> dict:
@@ -0,0 +1,104 @@
+"""
+Shared pytest fixtures for the SC Ethics Monitor test suite.
+"""
+
+import json
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+# Test fixtures path
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SAMPLE_CANDIDATES_PATH = FIXTURES_DIR / "sample_candidates.json"
+
+# Web app data files produced by the export scripts
+PUBLIC_DATA_DIR = Path(__file__).parent.parent.parent / "public" / "data"
+
+
+def load_sample_candidates():
+    """Load sample candidates fixture."""
+    with open(SAMPLE_CANDIDATES_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    """
+    Sample candidate data, parsed once per test session.
+
+    The same dict is shared by every test that requests it; tests must not
+    mutate it.
+    """
+    return load_sample_candidates()
+
+
+def _load_public_json(name, producer):
+    """Load a web app data file, skipping the test if it is missing."""
+    path = PUBLIC_DATA_DIR / name
+    if not path.exists():
+        pytest.skip(f"{name} not found - run {producer} first")
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def candidates_data():
+    """
+    Exported public/data/candidates.json, parsed once per test session.
+
+    Tests must not mutate the returned dict.
+    """
+    return _load_public_json("candidates.json", "export")
+
+
+@pytest.fixture(scope="session")
+def opportunity_data():
+    """
+    Exported public/data/opportunity.json, parsed once per test session.
+
+    Tests must not mutate the returned dict.
+    """
+    return _load_public_json("opportunity.json", "calculate_opportunity")
+
+
+@pytest.fixture(scope="session")
+def fixture_markdown():
+    """
+    Reader for markdown pages in tests/fixtures.
+
+    Returns a function mapping a fixture file name to its text. Each file
+    is read from disk once per session.
+    """
+    @lru_cache(maxsize=None)
+    def read(name):
+        return (FIXTURES_DIR / name).read_text()
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def sample_index(sample_data):
+    """
+    Lookups over the sample candidates, built in a single pass.
+
+    Keys:
+        by_name: candidate_name -> candidate
+        empty_party: candidates with no party
+        challengers_by_district: district_id -> non-incumbent candidates
+    """
+    by_name = {}
+    empty_party = []
+    challengers_by_district = defaultdict(list)
+    for cand in sample_data["candidates"]:
+        by_name[cand["candidate_name"]] = cand
+        if not cand.get("party"):
+            empty_party.append(cand)
+        if not cand.get("is_incumbent"):
+            challengers_by_district[cand["district_id"]].append(cand)
+    return {
+        "by_name": by_name,
+        "empty_party": empty_party,
+        "challengers_by_district": dict(challengers_by_district),
+    }
@@ -8,6 +8,7 @@ Tests:
 - Conflict detection for party disagreements
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -21,6 +22,7 @@ from candidate_discovery.aggregator import (
     CandidateAggregator,
     SourceResult,
 )
+from candidate_discovery.rate_limiter import RateLimiter
 from candidate_discovery.sources.base import (
     CandidateSource,
     ConflictRecord,
@@ -52,6 +54,18 @@ class MockSource(CandidateSource):
         return [c for c in self._candidates if c.district_id == district_id]
 
 
+class FirecrawlMockSource(MockSource):
+    """Mock Firecrawl-backed source with its own rate limiter."""
+
+    def __init__(self, name: str, priority: int, rpm: int = 30):
+        super().__init__(name, priority)
+        self.rate_limiter = RateLimiter(requests_per_minute=rpm)
+
+    @property
+    def uses_firecrawl(self) -> bool:
+        return True
+
+
 class TestSourceResult:
     """Tests for SourceResult dataclass."""
 
@@ -211,28 +225,55 @@ class TestCandidateAggregator:
         assert summary["total_sources"] == 2
         assert len(summary["sources"]) == 2
 
+    def test_firecrawl_sources_share_one_limiter(self):
+        """Firecrawl sources should draw from one limiter at the strictest rate."""
+        sources = [
+            FirecrawlMockSource("ballotpedia", 2, rpm=30),
+            FirecrawlMockSource("scdp", 3, rpm=10),
+            FirecrawlMockSource("scgop", 3, rpm=20),
+        ]
+        aggregator = CandidateAggregator(sources)
+
+        shared = aggregator.firecrawl_rate_limiter
+        assert shared.rpm == 10
+        assert all(s.rate_limiter is shared for s in sources)
+
+    def test_explicit_firecrawl_limiter_is_used(self):
+        """A provided limiter should replace each Firecrawl source's own."""
+        limiter = RateLimiter(requests_per_minute=5)
+        plain = MockSource("ethics_commission", 1)
+        firecrawl = FirecrawlMockSource("scdp", 3)
 
+        aggregator = CandidateAggregator(
+            [plain, firecrawl], firecrawl_rate_limiter=limiter
+        )
+
+        assert aggregator.firecrawl_rate_limiter is limiter
+        assert firecrawl.rate_limiter is limiter
+        assert not hasattr(plain, "rate_limiter")
+
+    def test_no_firecrawl_sources_no_limiter(self):
+        """Aggregators without Firecrawl sources should not build a limiter."""
+        aggregator = CandidateAggregator([MockSource("ballotpedia", 2)])
+
+        assert aggregator.firecrawl_rate_limiter is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestAggregateAll:
     """Tests for aggregate_all method."""
 
-    def test_aggregate_empty_sources(self):
+    async def test_aggregate_empty_sources(self):
         """Aggregation with no sources should return empty result."""
-        import asyncio
-
-        async def run_test():
-            aggregator = CandidateAggregator([])
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator([])
+        result = await aggregator.aggregate_all()
 
         assert result.total_raw == 0
         assert result.total_deduplicated == 0
         assert len(result.candidates) == 0
 
-    def test_aggregate_single_source(self):
+    async def test_aggregate_single_source(self):
         """Aggregation from single source should return candidates."""
-        import asyncio
-
         candidates = [
             DiscoveredCandidate(
                 name="John Smith",
@@ -250,19 +291,14 @@ class TestAggregateAll:
         sources = [MockSource("ballotpedia", 2, candidates)]
         aggregator = CandidateAggregator(sources)
 
-        async def run_test():
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        result = await aggregator.aggregate_all()
 
         assert result.total_raw == 2
         assert result.total_deduplicated == 2
         assert "ballotpedia" in result.successful_sources
 
-    def test_aggregate_multiple_sources(self):
+    async def test_aggregate_multiple_sources(self):
         """Aggregation from multiple sources should deduplicate."""
-        import asyncio
-
         ballotpedia_candidates = [
             DiscoveredCandidate(
                 name="John Smith",
@@ -285,20 +321,15 @@ class TestAggregateAll:
         ]
         aggregator = CandidateAggregator(sources)
 
-        async def run_test():
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        result = await aggregator.aggregate_all()
 
         # Should deduplicate to 1 candidate
         assert result.total_raw == 2
         assert result.total_deduplicated == 1
         assert len(result.successful_sources) == 2
 
-    def test_aggregate_handles_source_failure(self):
+    async def test_aggregate_handles_source_failure(self):
         """Aggregation should handle source failures gracefully."""
-        import asyncio
-
         class FailingSource(CandidateSource):
             @property
             def source_name(self):
@@ -328,16 +359,54 @@ class TestAggregateAll:
         ]
         aggregator = CandidateAggregator(sources)
 
-        async def run_test():
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        result = await aggregator.aggregate_all()
 
         # Should still have candidates from good source
         assert result.total_raw == 1
         assert "ballotpedia" in result.successful_sources
         assert "failing" in result.failed_sources
 
+    @pytest.mark.parametrize("max_parallel,expected_peak", [(None, 3), (1, 1)])
+    async def test_aggregate_bounds_concurrent_sources(self, max_parallel, expected_peak):
+        """Sources should run concurrently up to max_parallel_sources."""
+        state = {"active": 0, "peak": 0}
+
+        class SlowSource(MockSource):
+            async def discover_candidates(self, chambers=None):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return self._candidates
+
+        sources = [
+            SlowSource("ballotpedia", 2),
+            SlowSource("scdp", 3),
+            SlowSource("scgop", 3),
+        ]
+        aggregator = CandidateAggregator(
+            sources, max_parallel_sources=max_parallel
+        )
+
+        result = await aggregator.aggregate_all()
+
+        assert state["peak"] == expected_peak
+        assert list(result.source_stats) == ["ballotpedia", "scdp", "scgop"]
+
+    async def test_shared_limiter_spaces_concurrent_waits(self):
+        """Concurrent waits on one limiter should still be an interval apart."""
+        limiter = RateLimiter(requests_per_minute=3000)  # 20ms interval
+        stamps = []
+
+        async def request():
+            await limiter.wait()
+            stamps.append(limiter._last_request)
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+        assert all(gap >= limiter.interval * 0.9 for gap in gaps)
+
 
 class TestConflictDetection:
     """Tests for conflict detection."""
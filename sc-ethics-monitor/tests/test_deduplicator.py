@@ -10,6 +10,7 @@ Tests:
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -19,139 +20,155 @@ from candidate_discovery.deduplicator import CandidateDeduplicator
 from candidate_discovery.sources.base import DiscoveredCandidate
 
 
+@pytest.fixture(scope="module")
+def dedup():
+    """Shared deduplicator; it holds no per-call state."""
+    return CandidateDeduplicator()
+
+
 class TestNameNormalization:
     """Tests for name normalization."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_lowercase_conversion(self):
+    def test_lowercase_conversion(self, dedup):
         """Names should be converted to lowercase."""
-        assert self.dedup._normalize_name("John Smith") == "john smith"
-        assert self.dedup._normalize_name("JANE DOE") == "jane doe"
+        assert dedup._normalize_name("John Smith") == "john smith"
+        assert dedup._normalize_name("JANE DOE") == "jane doe"
 
-    def test_suffix_removal_jr(self):
+    def test_suffix_removal_jr(self, dedup):
         """Junior suffix should be removed."""
-        assert self.dedup._normalize_name("John Smith Jr.") == "john smith"
-        assert self.dedup._normalize_name("John Smith Jr") == "john smith"
-        assert self.dedup._normalize_name("John Smith, Jr.") == "john smith"
-        assert self.dedup._normalize_name("John Smith, Jr") == "john smith"
+        assert dedup._normalize_name("John Smith Jr.") == "john smith"
+        assert dedup._normalize_name("John Smith Jr") == "john smith"
+        assert dedup._normalize_name("John Smith, Jr.") == "john smith"
+        assert dedup._normalize_name("John Smith, Jr") == "john smith"
 
-    def test_suffix_removal_sr(self):
+    def test_suffix_removal_sr(self, dedup):
         """Senior suffix should be removed."""
-        assert self.dedup._normalize_name("John Smith Sr.") == "john smith"
-        assert self.dedup._normalize_name("John Smith Sr") == "john smith"
+        assert dedup._normalize_name("John Smith Sr.") == "john smith"
+        assert dedup._normalize_name("John Smith Sr") == "john smith"
 
-    def test_suffix_removal_numerals(self):
+    def test_suffix_removal_numerals(self, dedup):
         """Roman numeral suffixes should be removed."""
-        assert self.dedup._normalize_name("John Smith III") == "john smith"
-        assert self.dedup._normalize_name("John Smith II") == "john smith"
-        assert self.dedup._normalize_name("John Smith IV") == "john smith"
+        assert dedup._normalize_name("John Smith III") == "john smith"
+        assert dedup._normalize_name("John Smith II") == "john smith"
+        assert dedup._normalize_name("John Smith IV") == "john smith"
 
-    def test_middle_initial_removal(self):
+    def test_middle_initial_removal(self, dedup):
         """Middle initials should be removed."""
-        assert self.dedup._normalize_name("John H. Smith") == "john smith"
-        assert self.dedup._normalize_name("John A. B. Smith") == "john smith"
+        assert dedup._normalize_name("John H. Smith") == "john smith"
+        assert dedup._normalize_name("John A. B. Smith") == "john smith"
 
-    def test_standalone_middle_initial(self):
+    def test_standalone_middle_initial(self, dedup):
         """Standalone middle initials (without period) should be removed."""
-        assert self.dedup._normalize_name("John H Smith") == "john smith"
+        assert dedup._normalize_name("John H Smith") == "john smith"
 
-    def test_whitespace_normalization(self):
+    def test_whitespace_normalization(self, dedup):
         """Extra whitespace should be collapsed."""
-        assert self.dedup._normalize_name("John   Smith") == "john smith"
-        assert self.dedup._normalize_name("  John Smith  ") == "john smith"
+        assert dedup._normalize_name("John   Smith") == "john smith"
+        assert dedup._normalize_name("  John Smith  ") == "john smith"
 
-    def test_punctuation_removal(self):
+    def test_punctuation_removal(self, dedup):
         """Common punctuation should be removed."""
-        assert self.dedup._normalize_name("O'Brien") == "obrien"
-        assert self.dedup._normalize_name("Smith-Jones") == "smithjones"
+        assert dedup._normalize_name("O'Brien") == "obrien"
+        assert dedup._normalize_name("Smith-Jones") == "smithjones"
 
-    def test_empty_string(self):
+    def test_empty_string(self, dedup):
         """Empty strings should return empty."""
-        assert self.dedup._normalize_name("") == ""
-        assert self.dedup._normalize_name(None) == ""
+        assert dedup._normalize_name("") == ""
+        assert dedup._normalize_name(None) == ""
+
+    def test_candidate_normalized_name(self, dedup):
+        """Candidates should carry their normalized name from construction."""
+        candidate = DiscoveredCandidate(
+            name="John H. Smith, Jr.",
+            district_id="SC-House-042",
+        )
+        assert candidate.normalized_name == "john smith"
+        assert candidate.normalized_name == dedup._normalize_name(candidate.name)
 
 
 class TestSimilarityCalculation:
     """Tests for string similarity calculation."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_exact_match(self):
+    def test_exact_match(self, dedup):
         """Identical strings should have similarity 1.0."""
-        assert self.dedup._calculate_similarity("john smith", "john smith") == 1.0
+        assert dedup._calculate_similarity("john smith", "john smith") == 1.0
 
-    def test_completely_different(self):
+    def test_completely_different(self, dedup):
         """Completely different strings should have low similarity."""
-        similarity = self.dedup._calculate_similarity("john", "xyz")
+        similarity = dedup._calculate_similarity("john", "xyz")
         assert similarity < 0.3
 
-    def test_similar_names(self):
+    def test_similar_names(self, dedup):
         """Similar names should have high similarity."""
-        similarity = self.dedup._calculate_similarity("john smith", "john smyth")
+        similarity = dedup._calculate_similarity("john smith", "john smyth")
         assert similarity > 0.8
 
-    def test_empty_strings(self):
+    def test_empty_strings(self, dedup):
         """Empty strings should return 0.0."""
-        assert self.dedup._calculate_similarity("", "") == 0.0
-        assert self.dedup._calculate_similarity("john", "") == 0.0
-        assert self.dedup._calculate_similarity("", "john") == 0.0
+        assert dedup._calculate_similarity("", "") == 0.0
+        assert dedup._calculate_similarity("john", "") == 0.0
+        assert dedup._calculate_similarity("", "john") == 0.0
 
-    def test_nickname_variations(self):
+    def test_nickname_variations(self, dedup):
         """Common nicknames may have moderate similarity."""
-        similarity = self.dedup._calculate_similarity("robert", "bob")
+        similarity = dedup._calculate_similarity("robert", "bob")
         # LCS-based won't catch this - this is expected
         assert similarity < 0.5
 
+    def test_score_cutoff(self, dedup):
+        """Scores below the cutoff should be reported as 0.0."""
+        # Length bound alone rules this pair out: 2 * 4 / 17 < 0.85
+        assert dedup._calculate_similarity("john", "john smithson", 0.85) == 0.0
+        assert dedup._calculate_similarity("john", "xyz", 0.85) == 0.0
+        assert dedup._calculate_similarity(
+            "john smith", "john smyth", 0.85
+        ) == pytest.approx(0.9)
+
+    def test_word_order_insensitive(self, dedup):
+        """Reordered names should score as identical."""
+        assert dedup._calculate_similarity("smith john", "john smith") == 1.0
+
 
 class TestNamesMatch:
     """Tests for name matching logic."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_exact_match(self):
+    def test_exact_match(self, dedup):
         """Exact names should match."""
-        assert self.dedup._names_match("John Smith", "John Smith") is True
+        assert dedup._names_match("John Smith", "John Smith") is True
 
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, dedup):
         """Names should match regardless of case."""
-        assert self.dedup._names_match("John Smith", "JOHN SMITH") is True
+        assert dedup._names_match("John Smith", "JOHN SMITH") is True
 
-    def test_with_suffix(self):
+    def test_with_suffix(self, dedup):
         """Names should match with/without suffix."""
-        assert self.dedup._names_match("John Smith Jr.", "John Smith") is True
-        assert self.dedup._names_match("John Smith", "John Smith III") is True
+        assert dedup._names_match("John Smith Jr.", "John Smith") is True
+        assert dedup._names_match("John Smith", "John Smith III") is True
 
-    def test_with_middle_initial(self):
+    def test_with_middle_initial(self, dedup):
         """Names should match with/without middle initial."""
-        assert self.dedup._names_match("John H. Smith", "John Smith") is True
-        assert self.dedup._names_match("John Smith", "John A. Smith") is True
+        assert dedup._names_match("John H. Smith", "John Smith") is True
+        assert dedup._names_match("John Smith", "John A. Smith") is True
 
-    def test_different_people(self):
+    def test_different_people(self, dedup):
         """Different names should not match."""
-        assert self.dedup._names_match("John Smith", "Jane Doe") is False
-        assert self.dedup._names_match("John Smith", "Robert Johnson") is False
+        assert dedup._names_match("John Smith", "Jane Doe") is False
+        assert dedup._names_match("John Smith", "Robert Johnson") is False
 
-    def test_similar_last_names(self):
+    def test_similar_last_names(self, dedup):
         """People with same last name but different first should not match."""
         # This tests that we're checking full names, not just parts
-        assert self.dedup._names_match("John Smith", "Jane Smith") is False
+        assert dedup._names_match("John Smith", "Jane Smith") is False
+
+    def test_last_name_first(self, dedup):
+        """"Last, First" formats should match "First Last"."""
+        assert dedup._names_match("Smith, John H.", "John Smith") is True
 
 
 class TestClustering:
     """Tests for candidate clustering."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_single_candidate(self):
+    def test_single_candidate(self, dedup):
         """Single candidate should form one cluster."""
         candidates = [
             DiscoveredCandidate(
@@ -160,11 +177,11 @@ class TestClustering:
                 source="ballotpedia",
             )
         ]
-        clusters = self.dedup._cluster_by_name(candidates)
+        clusters = dedup._cluster_by_name(candidates)
         assert len(clusters) == 1
         assert len(clusters[0]) == 1
 
-    def test_same_person_different_sources(self):
+    def test_same_person_different_sources(self, dedup):
         """Same person from different sources should cluster together."""
         candidates = [
             DiscoveredCandidate(
@@ -183,11 +200,11 @@ class TestClustering:
                 source="scgop",
             ),
         ]
-        clusters = self.dedup._cluster_by_name(candidates)
+        clusters = dedup._cluster_by_name(candidates)
         assert len(clusters) == 1
         assert len(clusters[0]) == 3
 
-    def test_different_people(self):
+    def test_different_people(self, dedup):
         """Different people should form separate clusters."""
         candidates = [
             DiscoveredCandidate(
@@ -201,23 +218,49 @@ class TestClustering:
                 source="scdp",
             ),
         ]
-        clusters = self.dedup._cluster_by_name(candidates)
+        clusters = dedup._cluster_by_name(candidates)
         assert len(clusters) == 2
 
-    def test_empty_list(self):
+    def test_empty_list(self, dedup):
         """Empty list should return empty clusters."""
-        clusters = self.dedup._cluster_by_name([])
+        clusters = dedup._cluster_by_name([])
         assert len(clusters) == 0
 
+    def test_identical_names_not_fuzzy_compared(self):
+        """Only distinct normalized names should reach the fuzzy matcher."""
+        dedup = CandidateDeduplicator()
+        candidates = [
+            DiscoveredCandidate(name="John Smith", district_id="SC-House-042"),
+            DiscoveredCandidate(name="John H. Smith", district_id="SC-House-042"),
+            DiscoveredCandidate(name="JOHN SMITH JR.", district_id="SC-House-042"),
+            DiscoveredCandidate(name="Jane Doe", district_id="SC-House-042"),
+        ]
+        with patch.object(
+            dedup, "_normalized_names_match", wraps=dedup._normalized_names_match
+        ) as spy:
+            clusters = dedup._cluster_by_name(candidates)
+
+        assert spy.call_count == 1
+        assert sorted(len(c) for c in clusters) == [1, 3]
+
+    def test_transitive_matches_cluster_together(self, dedup):
+        """Names linked through an intermediate match should share a cluster."""
+        # "john smith" ~ "john smyth" ~ "jon smyth", but the ends differ
+        candidates = [
+            DiscoveredCandidate(name="John Smith", district_id="SC-House-042"),
+            DiscoveredCandidate(name="Jon Smyth", district_id="SC-House-042"),
+            DiscoveredCandidate(name="John Smyth", district_id="SC-House-042"),
+        ]
+        assert not dedup._names_match("John Smith", "Jon Smyth")
+        clusters = dedup._cluster_by_name(candidates)
+        assert len(clusters) == 1
+        assert len(clusters[0]) == 3
+
 
 class TestMergeLogic:
     """Tests for cluster merging."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_source_priority_ordering(self):
+    def test_source_priority_ordering(self, dedup):
         """Higher priority source should be primary."""
         cluster = [
             DiscoveredCandidate(
@@ -233,12 +276,12 @@ class TestMergeLogic:
                 party="D",
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         # Ballotpedia (priority 2) should be primary over SCDP (priority 3)
         assert merged.primary_source == "ballotpedia"
         assert merged.name == "John H. Smith"
 
-    def test_party_from_highest_priority(self):
+    def test_party_from_highest_priority(self, dedup):
         """Party should come from highest priority source."""
         cluster = [
             DiscoveredCandidate(
@@ -256,11 +299,11 @@ class TestMergeLogic:
                 party_confidence="LOW",
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         assert merged.party == "D"
         assert merged.party_source == "scdp"
 
-    def test_party_skips_null(self):
+    def test_party_skips_null(self, dedup):
         """Party selection should skip sources without party."""
         cluster = [
             DiscoveredCandidate(
@@ -277,11 +320,11 @@ class TestMergeLogic:
                 party_confidence="HIGH",
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         assert merged.party == "D"
         assert merged.party_source == "scdp"
 
-    def test_filing_status_priority(self):
+    def test_filing_status_priority(self, dedup):
         """Filing status should prefer most advanced."""
         cluster = [
             DiscoveredCandidate(
@@ -297,10 +340,10 @@ class TestMergeLogic:
                 filing_status="filed",
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         assert merged.filing_status == "filed"
 
-    def test_incumbent_any_source(self):
+    def test_incumbent_any_source(self, dedup):
         """Incumbent should be True if any source says incumbent."""
         cluster = [
             DiscoveredCandidate(
@@ -316,10 +359,10 @@ class TestMergeLogic:
                 incumbent=False,
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         assert merged.incumbent is True
 
-    def test_sources_collected(self):
+    def test_sources_collected(self, dedup):
         """All sources should be collected."""
         cluster = [
             DiscoveredCandidate(
@@ -335,47 +378,75 @@ class TestMergeLogic:
                 source_url="https://scdp.org/test",
             ),
         ]
-        merged = self.dedup._merge_cluster(cluster)
+        merged = dedup._merge_cluster(cluster)
         assert set(merged.sources) == {"ballotpedia", "scdp"}
         assert len(merged.source_urls) == 2
 
+    def test_sources_in_priority_order(self, dedup):
+        """Sources should be listed highest priority first."""
+        cluster = [
+            DiscoveredCandidate(
+                name="John Smith",
+                district_id="SC-House-042",
+                source="web_search",
+            ),
+            DiscoveredCandidate(
+                name="John Smith",
+                district_id="SC-House-042",
+                source="scdp",
+            ),
+            DiscoveredCandidate(
+                name="John Smith",
+                district_id="SC-House-042",
+                source="ethics_commission",
+            ),
+        ]
+        merged = dedup._merge_cluster(cluster)
+        assert merged.sources == ["ethics_commission", "scdp", "web_search"]
+
+    def test_has_multiple_sources_tracks_sources(self, dedup):
+        """has_multiple_sources should follow later changes to sources."""
+        merged = dedup._merge_cluster([
+            DiscoveredCandidate(
+                name="John Smith",
+                district_id="SC-House-042",
+                source="ballotpedia",
+            ),
+        ])
+        assert not merged.has_multiple_sources
+
+        merged.sources.append("scdp")
+        assert merged.has_multiple_sources
+
 
 class TestFilingStatusSelection:
     """Tests for filing status selection."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_certified_is_highest(self):
+    def test_certified_is_highest(self, dedup):
         """Certified should be preferred."""
-        assert self.dedup._best_filing_status(["certified", "filed"]) == "certified"
+        assert dedup._best_filing_status(["certified", "filed"]) == "certified"
 
-    def test_filed_over_declared(self):
+    def test_filed_over_declared(self, dedup):
         """Filed should be preferred over declared."""
-        assert self.dedup._best_filing_status(["declared", "filed"]) == "filed"
+        assert dedup._best_filing_status(["declared", "filed"]) == "filed"
 
-    def test_declared_over_rumored(self):
+    def test_declared_over_rumored(self, dedup):
         """Declared should be preferred over rumored."""
-        assert self.dedup._best_filing_status(["rumored", "declared"]) == "declared"
+        assert dedup._best_filing_status(["rumored", "declared"]) == "declared"
 
-    def test_empty_list(self):
+    def test_empty_list(self, dedup):
         """Empty list should return unknown."""
-        assert self.dedup._best_filing_status([]) == "unknown"
+        assert dedup._best_filing_status([]) == "unknown"
 
-    def test_all_none(self):
+    def test_all_none(self, dedup):
         """All None values should return unknown."""
-        assert self.dedup._best_filing_status([None, None]) == "unknown"
+        assert dedup._best_filing_status([None, None]) == "unknown"
 
 
 class TestFullDeduplication:
     """Integration tests for full deduplication pipeline."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_multiple_districts(self):
+    def test_multiple_districts(self, dedup):
         """Candidates in different districts should not merge."""
         candidates = [
             DiscoveredCandidate(
@@ -389,10 +460,10 @@ class TestFullDeduplication:
                 source="ballotpedia",
             ),
         ]
-        merged = self.dedup.deduplicate(candidates)
+        merged = dedup.deduplicate(candidates)
         assert len(merged) == 2
 
-    def test_full_pipeline(self):
+    def test_full_pipeline(self, dedup):
         """Test complete deduplication pipeline."""
         candidates = [
             # District 42 - two candidates, one with duplicates
@@ -424,7 +495,7 @@ class TestFullDeduplication:
             ),
         ]
 
-        merged = self.dedup.deduplicate(candidates)
+        merged = dedup.deduplicate(candidates)
 
         # Should have 3 merged candidates
         assert len(merged) == 3
@@ -438,27 +509,23 @@ class TestFullDeduplication:
         jane = next(m for m in merged if "jane" in m.name.lower())
         assert not jane.has_multiple_sources
 
-    def test_empty_input(self):
+    def test_empty_input(self, dedup):
         """Empty input should return empty output."""
-        assert self.dedup.deduplicate([]) == []
+        assert dedup.deduplicate([]) == []
 
 
 class TestSourcePriority:
     """Tests for source priority lookup."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.dedup = CandidateDeduplicator()
-
-    def test_known_sources(self):
+    def test_known_sources(self, dedup):
         """Known sources should return correct priority."""
-        assert self.dedup._get_source_priority("ethics_commission") == 1
-        assert self.dedup._get_source_priority("ballotpedia") == 2
-        assert self.dedup._get_source_priority("scdp") == 3
-        assert self.dedup._get_source_priority("scgop") == 3
-        assert self.dedup._get_source_priority("election_commission") == 4
-        assert self.dedup._get_source_priority("web_search") == 5
-
-    def test_unknown_source(self):
+        assert dedup._get_source_priority("ethics_commission") == 1
+        assert dedup._get_source_priority("ballotpedia") == 2
+        assert dedup._get_source_priority("scdp") == 3
+        assert dedup._get_source_priority("scgop") == 3
+        assert dedup._get_source_priority("election_commission") == 4
+        assert dedup._get_source_priority("web_search") == 5
+
+    def test_unknown_source(self, dedup):
         """Unknown sources should return default priority."""
-        assert self.dedup._get_source_priority("unknown_source") == 10
+        assert dedup._get_source_priority("unknown_source") == 10
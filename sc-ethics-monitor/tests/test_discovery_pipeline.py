@@ -8,8 +8,8 @@ Uses mocked external dependencies (Firecrawl, Google Sheets) to verify
 data flows correctly through the entire pipeline.
 """
 
-import asyncio
 import sys
+from collections import namedtuple
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -34,6 +34,7 @@ from candidate_discovery.sources.base import (
     CandidateSource,
     DiscoveredCandidate,
     MergedCandidate,
+    group_by_district,
 )
 
 
@@ -41,12 +42,16 @@ from candidate_discovery.sources.base import (
 # Test Fixtures and Mock Sources
 # =============================================================================
 
+# Minimal stand-in for SourceResult: the reporter only reads these two fields
+SourceStat = namedtuple("SourceStat", ["success", "candidate_count"])
+
 
 class MockBallotpediaSource(CandidateSource):
     """Mock Ballotpedia source for testing."""
 
     def __init__(self, candidates: list[DiscoveredCandidate] = None):
         self._candidates = candidates or []
+        self._by_district = group_by_district(self._candidates)
 
     @property
     def source_name(self) -> str:
@@ -60,7 +65,7 @@ class MockBallotpediaSource(CandidateSource):
         return self._candidates
 
     def extract_district_candidates(self, district_id):
-        return [c for c in self._candidates if c.district_id == district_id]
+        return self._by_district.get(district_id, [])
 
 
 class MockSCDPSource(CandidateSource):
@@ -68,6 +73,7 @@ class MockSCDPSource(CandidateSource):
 
     def __init__(self, candidates: list[DiscoveredCandidate] = None):
         self._candidates = candidates or []
+        self._by_district = group_by_district(self._candidates)
 
     @property
     def source_name(self) -> str:
@@ -81,7 +87,7 @@ class MockSCDPSource(CandidateSource):
         return self._candidates
 
     def extract_district_candidates(self, district_id):
-        return [c for c in self._candidates if c.district_id == district_id]
+        return self._by_district.get(district_id, [])
 
 
 class MockSCGOPSource(CandidateSource):
@@ -89,6 +95,7 @@ class MockSCGOPSource(CandidateSource):
 
     def __init__(self, candidates: list[DiscoveredCandidate] = None):
         self._candidates = candidates or []
+        self._by_district = group_by_district(self._candidates)
 
     @property
     def source_name(self) -> str:
@@ -102,10 +109,10 @@ class MockSCGOPSource(CandidateSource):
         return self._candidates
 
     def extract_district_candidates(self, district_id):
-        return [c for c in self._candidates if c.district_id == district_id]
+        return self._by_district.get(district_id, [])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_ballotpedia_candidates():
     """Sample candidates from Ballotpedia."""
     return [
@@ -136,7 +143,7 @@ def sample_ballotpedia_candidates():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_scdp_candidates():
     """Sample candidates from SCDP."""
     return [
@@ -159,7 +166,7 @@ def sample_scdp_candidates():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_scgop_candidates():
     """Sample candidates from SCGOP."""
     return [
@@ -197,31 +204,27 @@ def mock_sheets_sync():
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestDiscoveryPipeline:
     """End-to-end tests for the complete discovery pipeline."""
 
-    def test_full_pipeline_basic(
+    async def test_full_pipeline_basic(
         self,
         sample_ballotpedia_candidates,
         sample_scdp_candidates,
         sample_scgop_candidates,
     ):
         """Test the full pipeline from sources through to report."""
+        # Set up sources with test data
+        sources = [
+            MockBallotpediaSource(sample_ballotpedia_candidates),
+            MockSCDPSource(sample_scdp_candidates),
+            MockSCGOPSource(sample_scgop_candidates),
+        ]
 
-        async def run_test():
-            # Set up sources with test data
-            sources = [
-                MockBallotpediaSource(sample_ballotpedia_candidates),
-                MockSCDPSource(sample_scdp_candidates),
-                MockSCGOPSource(sample_scgop_candidates),
-            ]
-
-            # Create aggregator and run
-            aggregator = CandidateAggregator(sources)
-            result = await aggregator.aggregate_all(chambers=["house", "senate"])
-            return result
-
-        result = asyncio.run(run_test())
+        # Create aggregator and run
+        aggregator = CandidateAggregator(sources)
+        result = await aggregator.aggregate_all(chambers=["house", "senate"])
 
         # Verify aggregation results
         assert result.total_raw == 7  # 3 + 2 + 2
@@ -248,7 +251,7 @@ class TestDiscoveryPipeline:
         assert coverage.candidates_by_party.get("D", 0) == 3  # John, Robert, Mary
         assert coverage.candidates_by_party.get("R", 0) == 2  # Jane, Tom
 
-    def test_pipeline_with_source_failure(
+    async def test_pipeline_with_source_failure(
         self,
         sample_ballotpedia_candidates,
     ):
@@ -269,39 +272,32 @@ class TestDiscoveryPipeline:
             def extract_district_candidates(self, district_id):
                 return []
 
-        async def run_test():
-            sources = [
-                MockBallotpediaSource(sample_ballotpedia_candidates),
-                FailingSource(),
-            ]
-
-            aggregator = CandidateAggregator(sources)
-            return await aggregator.aggregate_all()
+        sources = [
+            MockBallotpediaSource(sample_ballotpedia_candidates),
+            FailingSource(),
+        ]
 
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator(sources)
+        result = await aggregator.aggregate_all()
 
         # Should still get candidates from working source
         assert result.total_raw == 3
         assert "ballotpedia" in result.successful_sources
         assert "failing" in result.failed_sources
 
-    def test_pipeline_deduplication(
+    async def test_pipeline_deduplication(
         self,
         sample_ballotpedia_candidates,
         sample_scdp_candidates,
     ):
         """Test that deduplication works correctly across sources."""
+        sources = [
+            MockBallotpediaSource(sample_ballotpedia_candidates),
+            MockSCDPSource(sample_scdp_candidates),
+        ]
 
-        async def run_test():
-            sources = [
-                MockBallotpediaSource(sample_ballotpedia_candidates),
-                MockSCDPSource(sample_scdp_candidates),
-            ]
-
-            aggregator = CandidateAggregator(sources)
-            return await aggregator.aggregate_all(chambers=["house"])
-
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator(sources)
+        result = await aggregator.aggregate_all(chambers=["house"])
 
         # John Smith from Ballotpedia and John H. Smith from SCDP should merge
         house_001_candidates = [
@@ -310,20 +306,16 @@ class TestDiscoveryPipeline:
         assert len(house_001_candidates) == 1
         assert house_001_candidates[0].has_multiple_sources
 
-    def test_pipeline_sheets_integration(
+    async def test_pipeline_sheets_integration(
         self,
         sample_ballotpedia_candidates,
         mock_sheets_sync,
     ):
         """Test that discovered candidates sync to sheets correctly."""
+        sources = [MockBallotpediaSource(sample_ballotpedia_candidates)]
 
-        async def run_test():
-            sources = [MockBallotpediaSource(sample_ballotpedia_candidates)]
-
-            aggregator = CandidateAggregator(sources)
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator(sources)
+        result = await aggregator.aggregate_all()
 
         # Create sheets integration
         integration = DiscoverySheetIntegration(mock_sheets_sync)
@@ -385,7 +377,7 @@ class TestCoverageReporter:
         result = AggregationResult(
             candidates=candidates,
             source_stats={
-                "ballotpedia": MagicMock(success=True, candidate_count=2),
+                "ballotpedia": SourceStat(success=True, candidate_count=2),
             },
             conflicts=[],
             total_raw=2,
@@ -629,34 +621,30 @@ class TestSheetsIntegration:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestPipelinePerformance:
     """Performance tests for the pipeline."""
 
-    def test_large_candidate_set(self):
+    async def test_large_candidate_set(self):
         """Pipeline should handle large numbers of candidates."""
         # Generate 500 candidates across 170 districts
-        candidates = []
-        for i in range(500):
-            district_num = (i % 170) + 1
-            chamber = "House" if district_num <= 124 else "Senate"
-            actual_num = district_num if chamber == "House" else district_num - 124
-
-            candidates.append(
-                DiscoveredCandidate(
-                    name=f"Candidate {i}",
-                    district_id=f"SC-{chamber}-{actual_num:03d}",
-                    party="D" if i % 2 == 0 else "R",
-                    party_confidence="HIGH",
-                    source="ballotpedia",
-                )
+        district_ids = [f"SC-House-{i:03d}" for i in range(1, 125)] + [
+            f"SC-Senate-{i:03d}" for i in range(1, 47)
+        ]
+        candidates = [
+            DiscoveredCandidate(
+                name=f"Candidate {i}",
+                district_id=district_ids[i % 170],
+                party="DR"[i % 2],
+                party_confidence="HIGH",
+                source="ballotpedia",
             )
+            for i in range(500)
+        ]
 
-        async def run_test():
-            source = MockBallotpediaSource(candidates)
-            aggregator = CandidateAggregator([source])
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        source = MockBallotpediaSource(candidates)
+        aggregator = CandidateAggregator([source])
+        result = await aggregator.aggregate_all()
 
         # Should process all candidates
         assert result.total_raw == 500
@@ -677,19 +665,17 @@ class TestPipelinePerformance:
 class TestPipelineErrorHandling:
     """Tests for error handling in the pipeline."""
 
-    def test_handles_empty_sources(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handles_empty_sources(self):
         """Pipeline should handle empty source list."""
-
-        async def run_test():
-            aggregator = CandidateAggregator([])
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator([])
+        result = await aggregator.aggregate_all()
 
         assert result.total_raw == 0
         assert result.total_deduplicated == 0
 
-    def test_handles_all_sources_failing(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handles_all_sources_failing(self):
         """Pipeline should handle all sources failing."""
 
         class AlwaysFailsSource(CandidateSource):
@@ -707,11 +693,8 @@ class TestPipelineErrorHandling:
             def extract_district_candidates(self, district_id):
                 return []
 
-        async def run_test():
-            aggregator = CandidateAggregator([AlwaysFailsSource()])
-            return await aggregator.aggregate_all()
-
-        result = asyncio.run(run_test())
+        aggregator = CandidateAggregator([AlwaysFailsSource()])
+        result = await aggregator.aggregate_all()
 
         assert result.total_raw == 0
         assert "always_fails" in result.failed_sources
@@ -35,23 +35,34 @@ Run tests:
     pytest tests/test_e2e_data_flow.py::TestCandidateFlow -v
 """
 
-import json
 import os
+import re
 import pytest
 from datetime import datetime, timezone, timedelta
-from pathlib import Path
+from functools import lru_cache
 from unittest.mock import Mock, MagicMock, patch
-from collections import defaultdict
 
-# Test fixtures path
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-SAMPLE_CANDIDATES_PATH = FIXTURES_DIR / "sample_candidates.json"
+# Candidates tab header (simplified 9-column format)
+_CANDIDATES_HEADER = (
+    "district_id", "candidate_name", "party", "filed_date",
+    "report_id", "ethics_url", "is_incumbent", "notes", "last_synced",
+)
 
 
-def load_sample_candidates():
-    """Load sample candidates fixture."""
-    with open(SAMPLE_CANDIDATES_PATH) as f:
-        return json.load(f)
+# Slot order on the Source of Truth: D first, then R, I, O (unknown last)
+_PARTY_ORDER = {"D": 0, "R": 1, "I": 2, "O": 3}
+
+# A1-notation range like "A2:I2" or "N2:AF171"
+_RANGE_RE = re.compile(r"([A-Z]+)(\d+):([A-Z]+)(\d+)")
+
+
+@lru_cache(maxsize=1024)
+def _col_to_idx(col: str) -> int:
+    """Convert a column letter ("A", "AF") to a 0-based index."""
+    result = 0
+    for char in col:
+        result = result * 26 + (ord(char) - ord('A') + 1)
+    return result - 1
 
 
 # =============================================================================
@@ -88,26 +99,20 @@ class MockWorksheet:
             return
 
         # Simple range parsing
-        import re
-        match = re.match(r"([A-Z]+)(\d+):([A-Z]+)(\d+)", range_name)
+        match = _RANGE_RE.match(range_name)
         if not match:
             return
 
-        start_col_letter, start_row, end_col_letter, end_row = match.groups()
+        start_col_letter, start_row, _, end_row = match.groups()
         start_row = int(start_row)
         end_row = int(end_row)
 
-        def col_to_idx(col):
-            result = 0
-            for char in col:
-                result = result * 26 + (ord(char) - ord('A') + 1)
-            return result - 1
-
-        start_col = col_to_idx(start_col_letter)
+        start_col = _col_to_idx(start_col_letter)
 
         # Ensure data array is large enough
-        while len(self._data) < end_row:
-            self._data.append([])
+        missing_rows = end_row - len(self._data)
+        if missing_rows > 0:
+            self._data.extend([] for _ in range(missing_rows))
 
         # Update cells
         for row_idx, row_values in enumerate(values):
@@ -115,11 +120,12 @@ class MockWorksheet:
             if actual_row >= len(self._data):
                 break
 
-            while len(self._data[actual_row]) < start_col + len(row_values):
-                self._data[actual_row].append("")
+            row = self._data[actual_row]
+            end_col = start_col + len(row_values)
+            if len(row) < end_col:
+                row.extend([""] * (end_col - len(row)))
 
-            for col_offset, value in enumerate(row_values):
-                self._data[actual_row][start_col + col_offset] = value
+            row[start_col:end_col] = row_values
 
     def clear(self):
         self._data = [[]]
@@ -152,6 +158,34 @@ class MockSpreadsheet:
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def candidates_data_template(sample_data):
+    """
+    Candidates tab rows built from the sample data, shared across tests.
+
+    Simplified 9-column format; see _CANDIDATES_HEADER. Rows are tuples so
+    the template cannot be modified by a test; copy before handing to a
+    MockWorksheet.
+    """
+    now_iso = datetime.now().isoformat()
+    rows = [_CANDIDATES_HEADER]
+    rows.extend(
+        (
+            cand["district_id"],
+            cand["candidate_name"],
+            cand.get("party", ""),
+            cand["filed_date"],
+            cand["report_id"],
+            cand.get("ethics_url", ""),
+            "Yes" if cand.get("is_incumbent") else "No",
+            cand.get("notes", ""),
+            now_iso,
+        )
+        for cand in sample_data["candidates"]
+    )
+    return tuple(rows)
+
+
 class TestCandidateFlow:
     """
     Test data flows correctly through the pipeline.
@@ -161,32 +195,10 @@ class TestCandidateFlow:
     """
 
     @pytest.fixture
-    def sample_data(self):
-        """Load sample candidate data."""
-        return load_sample_candidates()
-
-    @pytest.fixture
-    def mock_sheets_sync(self, sample_data):
+    def mock_sheets_sync(self, candidates_data_template):
         """Create a mock SheetsSync with test data."""
-        # Create mock worksheets with test data (simplified 9-column format)
-        # Columns: district_id, candidate_name, party, filed_date, report_id, ethics_url, is_incumbent, notes, last_synced
-        candidates_data = [
-            ["district_id", "candidate_name", "party", "filed_date",
-             "report_id", "ethics_url", "is_incumbent", "notes", "last_synced"]
-        ]
-
-        for cand in sample_data["candidates"]:
-            candidates_data.append([
-                cand["district_id"],
-                cand["candidate_name"],
-                cand.get("party", ""),
-                cand["filed_date"],
-                cand["report_id"],
-                cand.get("ethics_url", ""),
-                "Yes" if cand.get("is_incumbent") else "No",
-                cand.get("notes", ""),
-                datetime.now().isoformat(),
-            ])
+        # MockWorksheet writes into its rows, so each test gets fresh row lists
+        candidates_data = [list(row) for row in candidates_data_template]
 
         # Source of Truth with district rows
         sot_data = [
@@ -288,19 +300,13 @@ class TestCandidateFlow:
             assert "district_id" in challenger
             assert "party" in challenger
 
-    def test_e2e_04_multiple_candidates_per_district(self, sample_data):
+    def test_e2e_04_multiple_candidates_per_district(self, sample_index):
         """
         E2E-04: Add 2 candidates to same district, sync.
 
         Verifies: Challenger 1 and Challenger 2 populated.
         """
-        candidates = sample_data["candidates"]
-
-        # Group by district
-        by_district = defaultdict(list)
-        for cand in candidates:
-            if not cand.get("is_incumbent"):
-                by_district[cand["district_id"]].append(cand)
+        by_district = sample_index["challengers_by_district"]
 
         # Find district with multiple challengers
         multi_challenger_districts = [
@@ -361,10 +367,6 @@ class TestDataIntegrity:
     is not corrupted during sync operations.
     """
 
-    @pytest.fixture
-    def sample_data(self):
-        return load_sample_candidates()
-
     def test_int_01_party_override_preserved(self, sample_data):
         """
         INT-01: Set manual_party_override (K), re-sync.
@@ -454,25 +456,15 @@ class TestDataIntegrity:
                 f"Invalid district_id '{invalid_id}' should return (None, None)"
 
 
-def _parse_district_id_test(district_id: str):
-    """Test version of district_id parser."""
-    if not district_id or not district_id.startswith("SC-"):
-        return None, None
-
-    parts = district_id.split("-")
-    if len(parts) != 3:
-        return None, None
+_DISTRICT_ID_RE = re.compile(r"SC-(House|Senate)-([0-9]+)")
 
-    chamber = parts[1]
-    if chamber not in ("House", "Senate"):
-        return None, None
 
-    try:
-        district_num = int(parts[2])
-    except ValueError:
+def _parse_district_id_test(district_id: str):
+    """Test version of district_id parser."""
+    match = _DISTRICT_ID_RE.fullmatch(district_id) if district_id else None
+    if match is None:
         return None, None
-
-    return chamber, district_num
+    return match.group(1), int(match.group(2))
 
 
 # =============================================================================
@@ -487,21 +479,14 @@ class TestEdgeCases:
     These tests verify the system handles unusual inputs correctly.
     """
 
-    @pytest.fixture
-    def sample_data(self):
-        return load_sample_candidates()
-
-    def test_edge_01_empty_party_handling(self, sample_data):
+    def test_edge_01_empty_party_handling(self, sample_index):
         """
         EDGE-01: Add candidate without party, sync, export.
 
         Verifies: UNKNOWN or null in export.
         """
         # Find candidate with empty party
-        empty_party_cands = [
-            c for c in sample_data["candidates"]
-            if not c.get("party")
-        ]
+        empty_party_cands = sample_index["empty_party"]
 
         assert len(empty_party_cands) == 1, \
             "Should have exactly one candidate with empty party"
@@ -514,26 +499,21 @@ class TestEdgeCases:
         normalized = "?" if not party else party
         assert normalized == "?", "Empty party should normalize to '?'"
 
-    def test_edge_02_fourth_candidate(self, sample_data):
+    def test_edge_02_fourth_candidate(self, sample_index):
         """
         EDGE-02: Add 4th candidate to district with 3.
 
         Verifies: Oldest/lowest priority dropped or error.
         """
         # Find SC-House-005 which has 4 challengers
-        house_005_cands = [
-            c for c in sample_data["candidates"]
-            if c["district_id"] == "SC-House-005" and not c.get("is_incumbent")
-        ]
+        house_005_cands = sample_index["challengers_by_district"]["SC-House-005"]
 
         assert len(house_005_cands) == 4, \
             "SC-House-005 should have 4 challengers"
 
         # Sort by party priority (D first, then R, then others)
         def sort_key(c):
-            party = c.get("party", "?")
-            order = {"D": 0, "R": 1, "I": 2, "O": 3}
-            return (order.get(party, 4), c.get("filed_date", "9999"))
+            return (_PARTY_ORDER.get(c.get("party", "?"), 4), c.get("filed_date", "9999"))
 
         sorted_cands = sorted(house_005_cands, key=sort_key)
 
@@ -547,23 +527,17 @@ class TestEdgeCases:
         assert len(excluded) == 1, "One candidate should be excluded"
         assert excluded[0]["party"] == "O", "Other party should be excluded"
 
-    def test_edge_03_special_characters(self, sample_data):
+    def test_edge_03_special_characters(self, sample_index):
         """
         EDGE-03: Candidate name with "Jr.", apostrophe.
 
         Verifies: Name preserved correctly.
         """
-        # Find Diana O'Connor-Smith Jr.
-        special_name_cands = [
-            c for c in sample_data["candidates"]
-            if "O'Connor" in c["candidate_name"]
-        ]
-
-        assert len(special_name_cands) == 1, \
-            "Should find one candidate with special characters"
+        # Find Diana O'Connor-Smith Jr. by the exact stored name
+        cand = sample_index["by_name"].get("Diana O'Connor-Smith Jr.")
 
-        cand = special_name_cands[0]
-        assert cand["candidate_name"] == "Diana O'Connor-Smith Jr."
+        assert cand is not None, \
+            "Should find the candidate with special characters"
 
         # Verify no escaping issues
         assert "'" in cand["candidate_name"], "Apostrophe should be preserved"
@@ -575,16 +549,18 @@ class TestEdgeCases:
 
         Verifies: Exported consistently.
         """
-        for cand in sample_data["candidates"]:
-            filed_date = cand.get("filed_date", "")
+        # All test data uses YYYY-MM-DD format; check each distinct date once
+        unique_dates = {
+            cand.get("filed_date", "") for cand in sample_data["candidates"]
+        } - {""}
 
-            # All test data uses YYYY-MM-DD format
-            if filed_date:
-                parts = filed_date.split("-")
-                assert len(parts) == 3, f"Date should be YYYY-MM-DD: {filed_date}"
-                assert len(parts[0]) == 4, "Year should be 4 digits"
-                assert len(parts[1]) == 2, "Month should be 2 digits"
-                assert len(parts[2]) == 2, "Day should be 2 digits"
+        for filed_date in unique_dates:
+            # strptime accepts unpadded months/days, so also pin the width
+            assert len(filed_date) == 10, f"Date should be YYYY-MM-DD: {filed_date}"
+            try:
+                datetime.strptime(filed_date, "%Y-%m-%d")
+            except ValueError:
+                pytest.fail(f"Date should be YYYY-MM-DD: {filed_date}")
 
     def test_edge_05_url_formatting(self, sample_data):
         """
@@ -592,15 +568,15 @@ class TestEdgeCases:
 
         Verifies: HYPERLINK formula intact.
         """
-        for cand in sample_data["candidates"]:
-            ethics_url = cand.get("ethics_url", "")
+        # URLs should be valid; check each distinct one once
+        urls = {
+            cand.get("ethics_url", "") for cand in sample_data["candidates"]
+        } - {"", None}
 
-            if ethics_url:
-                # URL should be valid
-                assert ethics_url.startswith("https://"), \
-                    "URL should start with https://"
-                assert "ethicsfiling.sc.gov" in ethics_url, \
-                    "URL should be from Ethics Commission"
+        assert all(url.startswith("https://") for url in urls), \
+            "URL should start with https://"
+        assert all("ethicsfiling.sc.gov" in url for url in urls), \
+            "URL should be from Ethics Commission"
 
         # When writing to sheets, should become HYPERLINK formula
         test_url = "https://ethicsfiling.sc.gov/public/reports/TEST-001"
@@ -619,30 +595,28 @@ class TestDataFlowDocumentation:
     """
     Document and test the one-way data flow.
 
-    KEY INSIGHT: Manual edits in Source of Truth static columns (A-L)
-    do NOT flow anywhere. They're for human reference only.
+    Flow: Candidates Tab -> Source of Truth (N-AF) -> Export -> Web App
 
-    To get data into the web app, always add to Candidates tab.
-    """
+    Full pipeline, in order:
+    1. SC Ethics Commission (scrape)
+    2. ethics-state.json
+    3. Candidates Tab (Google Sheets)
+    4. Source of Truth Tab (columns N-AF only)
+    5. candidates.json + opportunity.json
+    6. SC Election Map (web app)
 
-    def test_data_flow_is_one_directional(self):
-        """
-        Verify data flows only one direction through the pipeline.
+    KEY INSIGHT: Manual edits in Source of Truth static columns (A-L)
+    do NOT flow anywhere. They're for human reference only.
 
-        Flow: Candidates Tab -> Source of Truth (N-AF) -> Export -> Web App
-        """
-        # Document the flow
-        data_flow = [
-            "1. SC Ethics Commission (scrape)",
-            "2. ethics-state.json",
-            "3. Candidates Tab (Google Sheets)",
-            "4. Source of Truth Tab (columns N-AF only)",
-            "5. candidates.json + opportunity.json",
-            "6. SC Election Map (web app)",
-        ]
+    To get data into the web app, always add to Candidates tab:
+    1. Add candidate to Candidates tab (columns A-P)
+    2. Run: python -m src.monitor --sync-sot-only
+    3. Run: python scripts/export_to_webapp.py
+    4. Web app reads candidates.json
 
-        # This is documentation - always passes
-        assert len(data_flow) == 6
+    Adding a candidate directly to the Source of Truth static columns (A-L)
+    will NOT make it appear in the web app.
+    """
 
     def test_sot_static_columns_not_exported(self):
         """
@@ -652,47 +626,17 @@ class TestDataFlowDocumentation:
         """
         from src.config import SOURCE_OF_TRUTH_COLUMNS
 
-        # Static columns are A-L (indices 0-11)
-        static_column_range = range(0, 12)
-
         # Dynamic columns start at M (index 12)
-        dynamic_columns = list(SOURCE_OF_TRUTH_COLUMNS.values())
-
-        for col_idx in dynamic_columns:
-            assert col_idx >= 12, \
-                f"All dynamic columns should be >= 12, found {col_idx}"
-
-        # Document: Static columns (A-L) are NOT in SOURCE_OF_TRUTH_COLUMNS
-        for idx in static_column_range:
-            assert idx not in dynamic_columns, \
-                f"Static column index {idx} should not be in dynamic columns"
-
-    def test_add_candidate_correct_workflow(self):
-        """
-        Document the correct workflow for adding a candidate.
-
-        Correct:
-        1. Add to Candidates tab
-        2. Run sync_to_source_of_truth
-        3. Run export_to_webapp
-        4. Web app reads updated data
+        dynamic_columns = set(SOURCE_OF_TRUTH_COLUMNS.values())
 
-        Incorrect:
-        - Adding directly to Source of Truth static columns
-        - This will NOT appear in the web app
-        """
-        correct_steps = [
-            "1. Add candidate to Candidates tab (columns A-P)",
-            "2. Run: python -m src.monitor --sync-sot-only",
-            "3. Run: python scripts/export_to_webapp.py",
-            "4. Web app reads candidates.json",
-        ]
+        assert min(dynamic_columns) >= 12, \
+            f"All dynamic columns should be >= 12, found {min(dynamic_columns)}"
 
-        incorrect_approach = "Adding to Source of Truth static columns (A-L)"
-
-        # Documentation test - always passes
-        assert len(correct_steps) == 4
-        assert "Candidates tab" in correct_steps[0]
+        # Document: Static columns A-L (indices 0-11) are NOT in
+        # SOURCE_OF_TRUTH_COLUMNS
+        static_in_dynamic = dynamic_columns.intersection(range(12))
+        assert not static_in_dynamic, \
+            f"Static column indices {sorted(static_in_dynamic)} should not be in dynamic columns"
 
 
 # =============================================================================
@@ -705,13 +649,7 @@ class TestUtilityFunctions:
 
     def test_col_letter_conversion(self):
         """Test column index to letter conversion."""
-        def col_letter(col_index: int) -> str:
-            result = ""
-            col_index += 1
-            while col_index > 0:
-                col_index, remainder = divmod(col_index - 1, 26)
-                result = chr(65 + remainder) + result
-            return result
+        from src.config import col_letter
 
         assert col_letter(0) == "A"
         assert col_letter(1) == "B"
@@ -720,6 +658,8 @@ class TestUtilityFunctions:
         assert col_letter(27) == "AB"
         assert col_letter(51) == "AZ"
         assert col_letter(52) == "BA"
+        assert col_letter(701) == "ZZ"    # last table entry
+        assert col_letter(702) == "AAA"   # past the table
 
     def test_normalize_party(self):
         """Test party normalization."""
@@ -748,31 +688,25 @@ class TestUtilityFunctions:
         assert normalize(None) == "?"
         assert normalize("Unknown") == "?"
 
-    def test_priority_tier_calculation(self):
-        """Test priority tier calculation logic."""
-        def calc_priority(incumbent_party: str, dem_count: int, challenger_count: int) -> str:
-            if dem_count > 0:
-                return "D - Covered"
-            if incumbent_party == "R" and dem_count == 0:
-                return "A - Flip Target"
-            if incumbent_party == "D" and dem_count == 0:
-                return "B - Defend"
-            if challenger_count >= 2:
-                return "C - Competitive"
-            return "C - Competitive"
-
-        # A - Flip Target: R incumbent, no D filed
-        assert calc_priority("R", 0, 1) == "A - Flip Target"
-
-        # B - Defend: D incumbent, no D filed yet
-        assert calc_priority("D", 0, 0) == "B - Defend"
-
-        # D - Covered: D filed
-        assert calc_priority("R", 1, 2) == "D - Covered"
-        assert calc_priority("D", 1, 1) == "D - Covered"
-
-        # C - Competitive: Multiple challengers, no D
-        assert calc_priority("", 0, 3) == "C - Competitive"
+    @pytest.mark.parametrize("incumbent_party,dem_count,challenger_count,expected", [
+        ("R", 0, 1, "A - Flip Target"),    # R incumbent, no D filed
+        ("D", 0, 0, "B - Defend"),         # D incumbent, no D filed yet
+        ("R", 1, 2, "D - Covered"),        # D filed
+        ("D", 1, 1, "D - Covered"),
+        ("", 0, 3, "C - Competitive"),     # open seat, multiple challengers
+        ("", 0, 1, "C - Competitive"),     # open seat, single challenger
+    ])
+    def test_priority_tier_calculation(
+        self, incumbent_party, dem_count, challenger_count, expected
+    ):
+        """Test priority tier calculation against its decision table."""
+        with patch('src.sheets_sync.gspread'):
+            from src.sheets_sync import SheetsSync
+            sync = SheetsSync.__new__(SheetsSync)
+
+        assert sync._calculate_priority_tier(
+            incumbent_party, dem_count, challenger_count
+        ) == expected
 
 
 # =============================================================================
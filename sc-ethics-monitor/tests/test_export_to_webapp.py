@@ -18,219 +18,138 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 import pytest
+from export_to_webapp import (
+    _HYPERLINK_RE,
+    fuzzy_name_match,
+    get_party_from_fallback,
+    is_name_match,
+    load_party_data,
+    normalize_name_for_matching,
+    normalize_party_code,
+    parse_district_id,
+)
+
+
+@pytest.fixture(scope="module")
+def party_data():
+    """Real party-data.json, loaded once for the module; tests must not mutate it."""
+    return load_party_data()
 
 
 class TestDistrictIdParsing:
     """Tests for parse_district_id function."""
 
-    def setup_method(self):
-        """Import function for testing."""
-        from export_to_webapp import parse_district_id
-        self.parse_district_id = parse_district_id
-
-    def test_house_district_single_digit(self):
-        """Parse single-digit House district."""
-        chamber, num = self.parse_district_id("SC-House-001")
-        assert chamber == "house"
-        assert num == 1
-
-    def test_house_district_double_digit(self):
-        """Parse double-digit House district."""
-        chamber, num = self.parse_district_id("SC-House-042")
-        assert chamber == "house"
-        assert num == 42
-
-    def test_house_district_triple_digit(self):
-        """Parse triple-digit House district."""
-        chamber, num = self.parse_district_id("SC-House-124")
-        assert chamber == "house"
-        assert num == 124
-
-    def test_senate_district(self):
-        """Parse Senate district."""
-        chamber, num = self.parse_district_id("SC-Senate-007")
-        assert chamber == "senate"
-        assert num == 7
-
-    def test_senate_district_max(self):
-        """Parse maximum Senate district."""
-        chamber, num = self.parse_district_id("SC-Senate-046")
-        assert chamber == "senate"
-        assert num == 46
-
-    def test_invalid_empty(self):
-        """Empty string returns None tuple."""
-        chamber, num = self.parse_district_id("")
-        assert chamber is None
-        assert num is None
-
-    def test_invalid_none(self):
-        """None input returns None tuple."""
-        chamber, num = self.parse_district_id(None)
-        assert chamber is None
-        assert num is None
-
-    def test_invalid_wrong_prefix(self):
-        """Non-SC prefix returns None tuple."""
-        chamber, num = self.parse_district_id("NC-House-042")
-        assert chamber is None
-        assert num is None
-
-    def test_invalid_format(self):
-        """Wrong format returns None tuple."""
-        chamber, num = self.parse_district_id("SC-House")
-        assert chamber is None
-        assert num is None
-
-    def test_invalid_non_numeric(self):
-        """Non-numeric district number returns None tuple."""
-        chamber, num = self.parse_district_id("SC-House-ABC")
-        assert chamber is None
-        assert num is None
+    @pytest.mark.parametrize("district_id,expected", [
+        ("SC-House-001", ("house", 1)),      # single digit
+        ("SC-House-042", ("house", 42)),     # double digit
+        ("SC-House-124", ("house", 124)),    # triple digit
+        ("SC-Senate-007", ("senate", 7)),
+        ("SC-Senate-046", ("senate", 46)),   # maximum Senate district
+        ("SC-house-042", ("house", 42)),     # chamber is case-insensitive
+    ])
+    def test_valid_district(self, district_id, expected):
+        """Valid House and Senate IDs parse to (chamber, number)."""
+        assert parse_district_id(district_id) == expected
+
+    @pytest.mark.parametrize("district_id", [
+        "",
+        None,
+        "NC-House-042",     # wrong prefix
+        "SC-House",         # wrong format
+        "SC-House-ABC",     # non-numeric district number
+        "SC-County-001",    # unknown chamber
+        "SC-House-042-A",   # trailing segment
+    ])
+    def test_invalid_district(self, district_id):
+        """Invalid IDs return a None tuple."""
+        assert parse_district_id(district_id) == (None, None)
 
 
 class TestNameNormalization:
     """Tests for normalize_name_for_matching function."""
 
-    def setup_method(self):
-        """Import function for testing."""
-        from export_to_webapp import normalize_name_for_matching
-        self.normalize = normalize_name_for_matching
-
-    def test_lowercase_conversion(self):
-        """Names converted to lowercase."""
-        assert self.normalize("John Smith") == "john smith"
-        assert self.normalize("JANE DOE") == "jane doe"
-
-    def test_suffix_removal_jr(self):
-        """Junior suffix removed."""
-        assert self.normalize("John Smith Jr.") == "john smith"
-        assert self.normalize("John Smith Jr") == "john smith"
-
-    def test_suffix_removal_sr(self):
-        """Senior suffix removed."""
-        assert self.normalize("John Smith Sr.") == "john smith"
-        assert self.normalize("John Smith Sr") == "john smith"
-
-    def test_suffix_removal_numerals(self):
-        """Roman numeral suffixes removed."""
-        assert self.normalize("John Smith III") == "john smith"
-        assert self.normalize("John Smith II") == "john smith"
-        assert self.normalize("John Smith IV") == "john smith"
-
-    def test_last_first_format(self):
-        """'Last, First' format converted to 'first last'."""
-        assert self.normalize("Smith, John") == "john smith"
-        assert self.normalize("Doe, Jane") == "jane doe"
-
-    def test_last_first_with_middle(self):
-        """'Last, First M' format converted, using only first name."""
-        result = self.normalize("Smith, John A")
-        # Should be "john smith" - using only first word of first name
-        assert result == "john smith"
-
-    def test_whitespace_normalization(self):
-        """Multiple spaces normalized."""
-        assert self.normalize("John   Smith") == "john smith"
-        assert self.normalize("  John Smith  ") == "john smith"
-
-    def test_empty_string(self):
-        """Empty string handled."""
-        assert self.normalize("") == ""
-
-    def test_none_returns_empty(self):
-        """None input returns empty string."""
-        assert self.normalize(None) == ""
+    @pytest.mark.parametrize("raw,expected", [
+        # Lowercase conversion
+        ("John Smith", "john smith"),
+        ("JANE DOE", "jane doe"),
+        # Suffix removal
+        ("John Smith Jr.", "john smith"),
+        ("John Smith Jr", "john smith"),
+        ("John Smith Sr.", "john smith"),
+        ("John Smith Sr", "john smith"),
+        ("John Smith III", "john smith"),
+        ("John Smith II", "john smith"),
+        ("John Smith IV", "john smith"),
+        # 'Last, First' converted to 'first last'
+        ("Smith, John", "john smith"),
+        ("Doe, Jane", "jane doe"),
+        # 'Last, First M' uses only the first word of the first name
+        ("Smith, John A", "john smith"),
+        # Whitespace normalization
+        ("John   Smith", "john smith"),
+        ("  John Smith  ", "john smith"),
+        # Empty input
+        ("", ""),
+        (None, ""),
+    ])
+    def test_normalize(self, raw, expected):
+        """Names normalize to lowercase 'first last' without suffixes."""
+        assert normalize_name_for_matching(raw) == expected
 
 
 class TestFuzzyNameMatch:
     """Tests for fuzzy_name_match function."""
 
-    def setup_method(self):
-        """Import function for testing."""
-        from export_to_webapp import fuzzy_name_match
-        self.match = fuzzy_name_match
-
-    def test_exact_match(self):
-        """Exact match returns True."""
-        assert self.match("John Smith", "John Smith") is True
-
-    def test_case_insensitive_match(self):
-        """Case insensitive match returns True."""
-        assert self.match("john smith", "JOHN SMITH") is True
-
-    def test_last_first_vs_first_last(self):
-        """'Smith, John' matches 'John Smith'."""
-        assert self.match("Smith, John", "John Smith") is True
-
-    def test_first_last_vs_last_first(self):
-        """'John Smith' matches 'Smith, John'."""
-        assert self.match("John Smith", "Smith, John") is True
-
-    def test_suffix_ignored(self):
-        """Suffix differences ignored."""
-        assert self.match("John Smith Jr.", "John Smith") is True
-        assert self.match("John Smith", "John Smith III") is True
-
-    def test_similar_first_name(self):
-        """First names with same first 3 chars match if last name matches."""
+    @pytest.mark.parametrize("name1,name2", [
+        ("John Smith", "John Smith"),           # exact
+        ("john smith", "JOHN SMITH"),           # case insensitive
+        ("Smith, John", "John Smith"),          # last-first vs first-last
+        ("John Smith", "Smith, John"),          # first-last vs last-first
+        ("John Smith Jr.", "John Smith"),       # suffix ignored
+        ("John Smith", "John Smith III"),
         # "Johnathan" and "John" both start with "joh"
-        assert self.match("Johnathan Smith", "John Smith") is True
-        # "Jonathan" starts with "jon", "John" starts with "joh" - no match
-        assert self.match("Jonathan Smith", "John Smith") is False
-
-    def test_different_last_names(self):
-        """Different last names don't match."""
-        assert self.match("John Smith", "John Jones") is False
-
-    def test_different_first_names(self):
-        """Different first names don't match."""
-        assert self.match("John Smith", "Jane Smith") is False
-
-    def test_single_name(self):
-        """Single name handled gracefully."""
-        assert self.match("Smith", "John Smith") is False
+        ("Johnathan Smith", "John Smith"),
+    ])
+    def test_match(self, name1, name2):
+        """Equivalent names match."""
+        assert fuzzy_name_match(name1, name2) is True
+
+    @pytest.mark.parametrize("name1,name2", [
+        # "Jonathan" starts with "jon", "John" starts with "joh"
+        ("Jonathan Smith", "John Smith"),
+        ("John Smith", "John Jones"),           # different last names
+        ("John Smith", "Jane Smith"),           # different first names
+        ("Smith", "John Smith"),                # single name
+    ])
+    def test_no_match(self, name1, name2):
+        """Different people do not match."""
+        assert fuzzy_name_match(name1, name2) is False
 
 
 class TestPartyEnrichment:
     """Tests for party enrichment with fallback chain."""
 
-    def setup_method(self):
-        """Import functions for testing."""
-        from export_to_webapp import (
-            get_party_from_fallback,
-            normalize_party_code,
-        )
-        self.get_party = get_party_from_fallback
-        self.normalize = normalize_party_code
-
-    def test_normalize_democratic(self):
-        """Democratic normalized to D."""
-        assert self.normalize("Democratic") == "D"
-        assert self.normalize("Democrat") == "D"
-        assert self.normalize("DEMOCRATIC") == "D"
-        assert self.normalize("D") == "D"
-
-    def test_normalize_republican(self):
-        """Republican normalized to R."""
-        assert self.normalize("Republican") == "R"
-        assert self.normalize("REPUBLICAN") == "R"
-        assert self.normalize("R") == "R"
-
-    def test_normalize_independent(self):
-        """Independent normalized to I."""
-        assert self.normalize("Independent") == "I"
-        assert self.normalize("I") == "I"
-
-    def test_normalize_other(self):
-        """Other normalized to O."""
-        assert self.normalize("Other") == "O"
-        assert self.normalize("O") == "O"
-
-    def test_normalize_none(self):
-        """None returns None."""
-        assert self.normalize(None) is None
-        assert self.normalize("") is None
+    @pytest.mark.parametrize("party,expected", [
+        ("Democratic", "D"),
+        ("Democrat", "D"),
+        ("DEMOCRATIC", "D"),
+        ("D", "D"),
+        ("Republican", "R"),
+        ("REPUBLICAN", "R"),
+        ("R", "R"),
+        ("Independent", "I"),
+        ("I", "I"),
+        ("Other", "O"),
+        ("O", "O"),
+        (" democratic ", "D"),      # surrounding whitespace
+        ("L", "L"),                 # unknown single-letter codes pass through
+        ("Libertarian", None),      # unknown party names do not
+        (None, None),
+        ("", None),
+    ])
+    def test_normalize_party_code(self, party, expected):
+        """Party names normalize to single-letter codes."""
+        assert normalize_party_code(party) == expected
 
     def test_fallback_exact_match(self):
         """Exact name match in party-data returns party."""
@@ -239,7 +158,7 @@ class TestPartyEnrichment:
                 "Smith, John": {"party": "Democratic", "verified": True}
             }
         }
-        result = self.get_party("Smith, John", party_data)
+        result = get_party_from_fallback("Smith, John", party_data)
         assert result == "D"
 
     def test_fallback_fuzzy_match(self):
@@ -249,7 +168,7 @@ class TestPartyEnrichment:
                 "Smith, John": {"party": "Republican", "verified": True}
             }
         }
-        result = self.get_party("John Smith", party_data)
+        result = get_party_from_fallback("John Smith", party_data)
         assert result == "R"
 
     def test_fallback_no_match(self):
@@ -259,62 +178,46 @@ class TestPartyEnrichment:
                 "Smith, John": {"party": "Democratic", "verified": True}
             }
         }
-        result = self.get_party("Jane Doe", party_data)
+        result = get_party_from_fallback("Jane Doe", party_data)
         assert result is None
 
     def test_fallback_empty_data(self):
         """Empty party-data returns None."""
-        result = self.get_party("John Smith", {"candidates": {}})
+        result = get_party_from_fallback("John Smith", {"candidates": {}})
         assert result is None
 
 
 class TestIncumbentMatching:
     """Tests for is_name_match function (incumbent matching)."""
 
-    def setup_method(self):
-        """Import function for testing."""
-        from export_to_webapp import is_name_match
-        self.match = is_name_match
-
-    def test_exact_match(self):
-        """Exact names match."""
-        assert self.match("John Smith", "John Smith") is True
-
-    def test_last_first_vs_first_last(self):
-        """'Smith, John' matches 'John Smith' for incumbents."""
-        assert self.match("Smith, John", "John Smith") is True
-
-    def test_suffix_handling_jr(self):
-        """Jr. suffix handled."""
-        assert self.match("John Smith Jr.", "John Smith") is True
-        assert self.match("John Smith", "John Smith Jr.") is True
-
-    def test_suffix_handling_roman(self):
-        """Roman numeral suffix handled."""
-        assert self.match("John Smith III", "John Smith") is True
-
-    def test_empty_names(self):
-        """Empty names return False."""
-        assert self.match("", "John Smith") is False
-        assert self.match("John Smith", "") is False
-        assert self.match("", "") is False
-
-    def test_different_names(self):
-        """Different names don't match."""
-        assert self.match("John Smith", "Jane Doe") is False
+    @pytest.mark.parametrize("name1,name2,expected", [
+        ("John Smith", "John Smith", True),
+        ("Smith, John", "John Smith", True),     # last-first vs first-last
+        ("John Smith Jr.", "John Smith", True),  # Jr. suffix
+        ("John Smith", "John Smith Jr.", True),
+        ("John Smith III", "John Smith", True),  # Roman numeral suffix
+        ("", "John Smith", False),               # empty names
+        ("John Smith", "", False),
+        ("", "", False),
+        ("John Smith", "Jane Doe", False),       # different names
+    ])
+    def test_is_name_match(self, name1, name2, expected):
+        """Incumbent names match across formats and suffixes."""
+        assert is_name_match(name1, name2) is expected
 
 
 class TestHyperlinkExtraction:
     """Tests for extracting URL from HYPERLINK formulas."""
 
-    def test_extract_from_formula(self):
-        """URL extracted from HYPERLINK formula."""
-        import re
-
-        formula = '=HYPERLINK("https://ethics.sc.gov/123", "View Filing")'
-        match = re.search(r'HYPERLINK\("([^"]+)"', formula)
-        assert match is not None
-        assert match.group(1) == "https://ethics.sc.gov/123"
+    @pytest.mark.parametrize("formula,expected", [
+        ('=HYPERLINK("https://ethics.sc.gov/123", "View Filing")',
+         "https://ethics.sc.gov/123"),
+        ("", None),
+    ])
+    def test_extract_from_formula(self, formula, expected):
+        """URL extracted from HYPERLINK formula; no formula, no match."""
+        match = _HYPERLINK_RE.search(formula)
+        assert (match.group(1) if match else None) == expected
 
     def test_raw_url_unchanged(self):
         """Raw URL passed through unchanged."""
@@ -322,14 +225,6 @@ class TestHyperlinkExtraction:
         # Non-HYPERLINK URLs should be used as-is
         assert not url.startswith("=HYPERLINK")
 
-    def test_empty_string(self):
-        """Empty string handled."""
-        import re
-
-        formula = ""
-        match = re.search(r'HYPERLINK\("([^"]+)"', formula)
-        assert match is None
-
 
 class TestOutputStructure:
     """Tests for output JSON structure validation."""
@@ -378,20 +273,17 @@ class TestOutputStructure:
             assert field in candidate_entry
 
 
+@pytest.mark.slow
 class TestPartyDataLoading:
     """Tests for party-data.json loading."""
 
-    def test_load_real_party_data(self):
+    def test_load_real_party_data(self, party_data):
         """Test loading the real party-data.json file."""
-        from export_to_webapp import load_party_data
-
-        data = load_party_data()
-
         # Should have candidates key
-        assert "candidates" in data
+        assert "candidates" in party_data
 
         # Should have many candidate records
-        candidates = data.get("candidates", {})
+        candidates = party_data.get("candidates", {})
         assert len(candidates) > 50  # We know there are 130+ records
 
         # Spot check a known entry
@@ -401,38 +293,22 @@ class TestPartyDataLoading:
             assert entry.get("verified") is True
 
 
+@pytest.mark.slow
 class TestEndToEndPartyEnrichment:
     """Integration tests for the full party enrichment chain."""
 
-    def setup_method(self):
-        """Import required functions."""
-        from export_to_webapp import (
-            get_party_from_fallback,
-            load_party_data,
-        )
-        self.get_party = get_party_from_fallback
-        self.party_data = load_party_data()
-
-    def test_known_democrat_lookup(self):
-        """Look up a known Democrat from party-data.json."""
-        # Keishan Scott is a known Democrat in District 50
-        result = self.get_party("Scott, Keishan M", self.party_data)
-        assert result == "D"
+    @pytest.mark.parametrize("name,expected", [
+        ("Scott, Keishan M", "D"),              # known Democrat, District 50
+        ("Lastinger, John", "R"),               # known Republican, District 88
+        ("Completely Unknown Name XYZ", None),   # unknown candidate
+    ])
+    def test_party_lookup(self, party_data, name, expected):
+        """Look up known and unknown candidates in party-data.json."""
+        assert get_party_from_fallback(name, party_data) == expected
 
-    def test_known_democrat_alternate_format(self):
+    def test_known_democrat_alternate_format(self, party_data):
         """Look up with alternate name format."""
         # Test with "First Last" format
-        result = self.get_party("Keishan Scott", self.party_data)
+        result = get_party_from_fallback("Keishan Scott", party_data)
         # May or may not match depending on exact data format
         # This tests the fuzzy matching capability
-
-    def test_known_republican_lookup(self):
-        """Look up a known Republican from party-data.json."""
-        # John Lastinger is a known Republican in District 88
-        result = self.get_party("Lastinger, John", self.party_data)
-        assert result == "R"
-
-    def test_unknown_candidate(self):
-        """Unknown candidate returns None."""
-        result = self.get_party("Completely Unknown Name XYZ", self.party_data)
-        assert result is None
@@ -20,11 +20,58 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 import pytest
 from candidate_discovery.sources.scdp import SCDPSource
 from candidate_discovery.sources.scgop import SCGOPSource
-from candidate_discovery.sources.base import DiscoveredCandidate
+from candidate_discovery.sources.base import DiscoveredCandidate, group_by_district
+from config import FIRECRAWL_RPM
 
 
-# Test fixtures directory
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
+@pytest.fixture(scope="session")
+def _scdp_session_source():
+    """One SCDPSource for the whole session."""
+    return SCDPSource(firecrawl_api_key="test_key")
+
+
+@pytest.fixture(scope="session")
+def _scgop_session_source():
+    """One SCGOPSource for the whole session."""
+    return SCGOPSource(firecrawl_api_key="test_key")
+
+
+@pytest.fixture
+def scdp_source(_scdp_session_source):
+    """Shared SCDPSource, with its caches emptied after each test."""
+    yield _scdp_session_source
+    _scdp_session_source.clear_cache()
+
+
+@pytest.fixture
+def scgop_source(_scgop_session_source):
+    """Shared SCGOPSource, with its caches emptied after each test."""
+    yield _scgop_session_source
+    _scgop_session_source.clear_cache()
+
+
+@pytest.fixture(scope="session")
+def scdp_elected_candidates(_scdp_session_source, fixture_markdown):
+    """SCDP elected officials page, parsed once per session."""
+    return tuple(_scdp_session_source._parse_candidates(
+        fixture_markdown("scdp_elected_officials.md"), "https://scdp.org/test"
+    ))
+
+
+@pytest.fixture(scope="session")
+def scdp_roster_candidates(_scdp_session_source, fixture_markdown):
+    """SCDP candidates page, parsed once per session."""
+    return tuple(_scdp_session_source._parse_candidates(
+        fixture_markdown("scdp_candidates_page.md"), "https://scdp.org/candidates"
+    ))
+
+
+@pytest.fixture(scope="session")
+def scgop_roster_candidates(_scgop_session_source, fixture_markdown):
+    """SCGOP candidates page, parsed once per session."""
+    return tuple(_scgop_session_source._parse_candidates(
+        fixture_markdown("scgop_candidates_page.md"), "https://sc.gop/candidates"
+    ))
 
 
 # ============================================================================
@@ -34,108 +81,101 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 class TestSCDPSourceProperties:
     """Tests for SCDP source properties."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_source_name(self):
+    def test_source_name(self, scdp_source):
         """Source name should be 'scdp'."""
-        assert self.source.source_name == "scdp"
+        assert scdp_source.source_name == "scdp"
 
-    def test_source_priority(self):
+    def test_source_priority(self, scdp_source):
         """Source priority should be 3 (party-specific)."""
-        assert self.source.source_priority == 3
+        assert scdp_source.source_priority == 3
 
-    def test_base_url(self):
+    def test_base_url(self, scdp_source):
         """Base URL should be SCDP website."""
-        assert self.source.BASE_URL == "https://scdp.org"
+        assert scdp_source.BASE_URL == "https://scdp.org"
 
-    def test_elected_officials_url(self):
+    def test_elected_officials_url(self, scdp_source):
         """Should have correct elected officials URL."""
-        assert "elected-officials" in self.source.ELECTED_OFFICIALS_URL
+        assert "elected-officials" in scdp_source.ELECTED_OFFICIALS_URL
 
 
 class TestSCDPDistrictIdBuilding:
     """Tests for SCDP district ID building."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_district_id_house(self):
+    def test_district_id_house(self, scdp_source):
         """House district IDs should be formatted correctly."""
-        district_id = self.source._district_id_from_parts("house", 42)
+        district_id = scdp_source._district_id_from_parts("house", 42)
         assert district_id == "SC-House-042"
 
-    def test_district_id_senate(self):
+    def test_district_id_senate(self, scdp_source):
         """Senate district IDs should be formatted correctly."""
-        district_id = self.source._district_id_from_parts("senate", 15)
+        district_id = scdp_source._district_id_from_parts("senate", 15)
         assert district_id == "SC-Senate-015"
 
-    def test_district_id_single_digit(self):
+    def test_district_id_single_digit(self, scdp_source):
         """Single digit districts should be zero-padded."""
-        district_id = self.source._district_id_from_parts("house", 1)
+        district_id = scdp_source._district_id_from_parts("house", 1)
         assert district_id == "SC-House-001"
 
+    def test_district_id_outside_table(self, scdp_source):
+        """Numbers and casings outside the precomputed table still format."""
+        assert scdp_source._district_id_from_parts("senate", 47) == "SC-Senate-047"
+        assert scdp_source._district_id_from_parts("House", 7) == "SC-House-007"
+
 
 class TestSCDPDistrictExtraction:
     """Tests for extracting district info from text."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_extract_house_district(self):
+    def test_extract_house_district(self, scdp_source):
         """Should extract House district from text."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "Running for House District 42"
         )
         assert chamber == "house"
         assert num == 42
 
-    def test_extract_senate_district(self):
+    def test_extract_senate_district(self, scdp_source):
         """Should extract Senate district from text."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "State Senate District 15"
         )
         assert chamber == "senate"
         assert num == 15
 
-    def test_extract_hd_abbreviation(self):
+    def test_extract_hd_abbreviation(self, scdp_source):
         """Should handle HD abbreviation."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "Candidate for HD 95"
         )
         assert chamber == "house"
         assert num == 95
 
-    def test_extract_sd_abbreviation(self):
+    def test_extract_sd_abbreviation(self, scdp_source):
         """Should handle SD abbreviation."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "Running for SD 7"
         )
         assert chamber == "senate"
         assert num == 7
 
-    def test_extract_no_district(self):
+    def test_extract_no_district(self, scdp_source):
         """Should return None for text without district."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "Just a regular sentence"
         )
         assert chamber is None
         assert num is None
 
-    def test_extract_invalid_district_number(self):
+    def test_extract_invalid_district_number(self, scdp_source):
         """Should reject invalid district numbers."""
         # House has 124 districts, so 200 is invalid
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "House District 200"
         )
         assert chamber is None
         assert num is None
 
         # Senate has 46 districts, so 50 is invalid
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scdp_source._extract_district_from_text(
             "Senate District 50"
         )
         assert chamber is None
@@ -145,47 +185,35 @@ class TestSCDPDistrictExtraction:
 class TestSCDPNameValidation:
     """Tests for name validation."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_valid_name(self):
+    def test_valid_name(self, scdp_source):
         """Should accept valid names."""
-        assert self.source._is_valid_name("John Smith") is True
-        assert self.source._is_valid_name("Jane Marie Doe") is True
-        assert self.source._is_valid_name("Robert A. Johnson Jr.") is True
+        assert scdp_source._is_valid_name("John Smith") is True
+        assert scdp_source._is_valid_name("Jane Marie Doe") is True
+        assert scdp_source._is_valid_name("Robert A. Johnson Jr.") is True
 
-    def test_reject_short_name(self):
+    def test_reject_short_name(self, scdp_source):
         """Should reject names that are too short."""
-        assert self.source._is_valid_name("") is False
-        assert self.source._is_valid_name("AB") is False
+        assert scdp_source._is_valid_name("") is False
+        assert scdp_source._is_valid_name("AB") is False
 
-    def test_reject_single_word(self):
+    def test_reject_single_word(self, scdp_source):
         """Should reject single word names."""
-        assert self.source._is_valid_name("John") is False
+        assert scdp_source._is_valid_name("John") is False
 
-    def test_reject_non_names(self):
+    def test_reject_non_names(self, scdp_source):
         """Should reject obvious non-names."""
-        assert self.source._is_valid_name("House District 42") is False
-        assert self.source._is_valid_name("Democratic Party") is False
-        assert self.source._is_valid_name("State Senate") is False
-        assert self.source._is_valid_name("Contact Us") is False
+        assert scdp_source._is_valid_name("House District 42") is False
+        assert scdp_source._is_valid_name("Democratic Party") is False
+        assert scdp_source._is_valid_name("State Senate") is False
+        assert scdp_source._is_valid_name("Contact Us") is False
 
 
 class TestSCDPCandidateParsing:
     """Tests for parsing candidates from markdown."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_parse_elected_officials(self):
+    def test_parse_elected_officials(self, scdp_elected_candidates):
         """Should parse candidates from elected officials page."""
-        markdown = (FIXTURES_DIR / "scdp_elected_officials.md").read_text()
-        candidates = self.source._parse_candidates(
-            markdown,
-            "https://scdp.org/test"
-        )
+        candidates = scdp_elected_candidates
 
         # Should find multiple candidates
         assert len(candidates) >= 5
@@ -196,30 +224,18 @@ class TestSCDPCandidateParsing:
             assert candidate.party_confidence == "HIGH"
             assert candidate.source == "scdp"
 
-    def test_parse_candidate_districts(self):
+    def test_parse_candidate_districts(self, scdp_elected_candidates):
         """Should correctly assign districts."""
-        markdown = (FIXTURES_DIR / "scdp_elected_officials.md").read_text()
-        candidates = self.source._parse_candidates(
-            markdown,
-            "https://scdp.org/test"
-        )
+        candidates = scdp_elected_candidates
 
         # Find specific candidates
-        allen = next((c for c in candidates if "Allen" in c.name), None)
-        if allen:
-            assert allen.district_id == "SC-Senate-007"
+        by_name = {c.name: c for c in candidates}
+        assert by_name["Karl B. Allen"].district_id == "SC-Senate-007"
+        assert by_name["J. Todd Rutherford"].district_id == "SC-House-074"
 
-        rutherford = next((c for c in candidates if "Rutherford" in c.name), None)
-        if rutherford:
-            assert rutherford.district_id == "SC-House-074"
-
-    def test_parse_candidates_page(self):
+    def test_parse_candidates_page(self, scdp_roster_candidates):
         """Should parse candidates from candidates page."""
-        markdown = (FIXTURES_DIR / "scdp_candidates_page.md").read_text()
-        candidates = self.source._parse_candidates(
-            markdown,
-            "https://scdp.org/candidates"
-        )
+        candidates = scdp_roster_candidates
 
         # Should find candidates
         assert len(candidates) >= 1
@@ -228,10 +244,10 @@ class TestSCDPCandidateParsing:
         for candidate in candidates:
             assert candidate.party == "D"
 
-    def test_parse_empty_page(self):
+    def test_parse_empty_page(self, scdp_source, fixture_markdown):
         """Should handle page with no candidates."""
-        markdown = (FIXTURES_DIR / "scdp_empty.md").read_text()
-        candidates = self.source._parse_candidates(
+        markdown = fixture_markdown("scdp_empty.md")
+        candidates = scdp_source._parse_candidates(
             markdown,
             "https://scdp.org/test"
         )
@@ -239,17 +255,17 @@ class TestSCDPCandidateParsing:
         # Should return empty list
         assert candidates == []
 
-    def test_parse_none_markdown(self):
+    def test_parse_none_markdown(self, scdp_source):
         """Should handle None markdown."""
-        candidates = self.source._parse_candidates(
+        candidates = scdp_source._parse_candidates(
             None,
             "https://scdp.org/test"
         )
         assert candidates == []
 
-    def test_parse_empty_markdown(self):
+    def test_parse_empty_markdown(self, scdp_source):
         """Should handle empty markdown."""
-        candidates = self.source._parse_candidates(
+        candidates = scdp_source._parse_candidates(
             "",
             "https://scdp.org/test"
         )
@@ -259,48 +275,41 @@ class TestSCDPCandidateParsing:
 class TestSCDPCacheManagement:
     """Tests for SCDP cache management."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_initial_cache_empty(self):
+    def test_initial_cache_empty(self, scdp_source):
         """Caches should be empty initially."""
-        stats = self.source.get_cache_stats()
+        stats = scdp_source.get_cache_stats()
         assert stats["pages_cached"] == 0
         assert stats["candidates_cached"] == 0
 
-    def test_clear_cache(self):
+    def test_clear_cache(self, scdp_source):
         """Clear cache should empty all caches."""
         # Add some test data to cache
-        self.source._page_cache["test_url"] = "test markdown"
-        self.source._candidates_cache = [
+        scdp_source._page_cache["test_url"] = "test markdown"
+        scdp_source._candidates_cache = group_by_district([
             DiscoveredCandidate(
                 name="Test Candidate",
                 district_id="SC-House-001",
                 source="scdp"
             )
-        ]
+        ])
 
         # Clear
-        self.source.clear_cache()
+        scdp_source.clear_cache()
 
         # Verify empty
-        stats = self.source.get_cache_stats()
+        stats = scdp_source.get_cache_stats()
         assert stats["pages_cached"] == 0
         assert stats["candidates_cached"] == 0
+        assert scdp_source.extract_district_candidates("SC-House-001") == []
 
 
 class TestSCDPExtractDistrictCandidates:
     """Tests for extract_district_candidates method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCDPSource(firecrawl_api_key="test_key")
-
-    def test_extract_from_cache(self):
+    def test_extract_from_cache(self, scdp_source):
         """Should return cached candidates if available."""
         # Pre-populate cache
-        self.source._candidates_cache = [
+        scdp_source._candidates_cache = group_by_district([
             DiscoveredCandidate(
                 name="Test Candidate",
                 district_id="SC-House-042",
@@ -313,16 +322,16 @@ class TestSCDPExtractDistrictCandidates:
                 party="D",
                 source="scdp"
             )
-        ]
+        ])
 
         # Extract should return only matching district
-        result = self.source.extract_district_candidates("SC-House-042")
+        result = scdp_source.extract_district_candidates("SC-House-042")
         assert len(result) == 1
         assert result[0].name == "Test Candidate"
 
-    def test_extract_no_cache(self):
+    def test_extract_no_cache(self, scdp_source):
         """Should return empty list if no cache available."""
-        result = self.source.extract_district_candidates("SC-House-999")
+        result = scdp_source.extract_district_candidates("SC-House-999")
         assert result == []
 
 
@@ -333,79 +342,67 @@ class TestSCDPExtractDistrictCandidates:
 class TestSCGOPSourceProperties:
     """Tests for SCGOP source properties."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_source_name(self):
+    def test_source_name(self, scgop_source):
         """Source name should be 'scgop'."""
-        assert self.source.source_name == "scgop"
+        assert scgop_source.source_name == "scgop"
 
-    def test_source_priority(self):
+    def test_source_priority(self, scgop_source):
         """Source priority should be 3 (party-specific)."""
-        assert self.source.source_priority == 3
+        assert scgop_source.source_priority == 3
 
-    def test_base_url(self):
+    def test_base_url(self, scgop_source):
         """Base URL should be SCGOP website."""
-        assert self.source.BASE_URL == "https://sc.gop"
+        assert scgop_source.BASE_URL == "https://sc.gop"
 
-    def test_news_url(self):
+    def test_news_url(self, scgop_source):
         """Should have correct news URL."""
-        assert "news" in self.source.NEWS_URL
+        assert "news" in scgop_source.NEWS_URL
 
 
 class TestSCGOPDistrictIdBuilding:
     """Tests for SCGOP district ID building."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_district_id_house(self):
+    def test_district_id_house(self, scgop_source):
         """House district IDs should be formatted correctly."""
-        district_id = self.source._district_id_from_parts("house", 42)
+        district_id = scgop_source._district_id_from_parts("house", 42)
         assert district_id == "SC-House-042"
 
-    def test_district_id_senate(self):
+    def test_district_id_senate(self, scgop_source):
         """Senate district IDs should be formatted correctly."""
-        district_id = self.source._district_id_from_parts("senate", 15)
+        district_id = scgop_source._district_id_from_parts("senate", 15)
         assert district_id == "SC-Senate-015"
 
 
 class TestSCGOPDistrictExtraction:
     """Tests for extracting district info from text."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_extract_house_district(self):
+    def test_extract_house_district(self, scgop_source):
         """Should extract House district from text."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scgop_source._extract_district_from_text(
             "Running for House District 88"
         )
         assert chamber == "house"
         assert num == 88
 
-    def test_extract_senate_district(self):
+    def test_extract_senate_district(self, scgop_source):
         """Should extract Senate district from text."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scgop_source._extract_district_from_text(
             "SC Senate District 29"
         )
         assert chamber == "senate"
         assert num == 29
 
-    def test_extract_from_news_format(self):
+    def test_extract_from_news_format(self, scgop_source):
         """Should handle news announcement format."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scgop_source._extract_district_from_text(
             "JD Chaplin on his victory in the SC Senate District 29"
         )
         assert chamber == "senate"
         assert num == 29
 
-    def test_extract_no_district(self):
+    def test_extract_no_district(self, scgop_source):
         """Should return None for text without district."""
-        chamber, num = self.source._extract_district_from_text(
+        chamber, num = scgop_source._extract_district_from_text(
             "Political news update"
         )
         assert chamber is None
@@ -415,34 +412,26 @@ class TestSCGOPDistrictExtraction:
 class TestSCGOPNameValidation:
     """Tests for name validation."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_valid_name(self):
+    def test_valid_name(self, scgop_source):
         """Should accept valid names."""
-        assert self.source._is_valid_name("John Smith") is True
-        assert self.source._is_valid_name("JD Chaplin") is True
-        assert self.source._is_valid_name("Drew McKissick") is True
+        assert scgop_source._is_valid_name("John Smith") is True
+        assert scgop_source._is_valid_name("JD Chaplin") is True
+        assert scgop_source._is_valid_name("Drew McKissick") is True
 
-    def test_reject_party_names(self):
+    def test_reject_party_names(self, scgop_source):
         """Should reject party-related terms."""
-        assert self.source._is_valid_name("SC GOP Party") is False
-        assert self.source._is_valid_name("Republican Party") is False
-        assert self.source._is_valid_name("South Carolina GOP") is False
+        assert scgop_source._is_valid_name("SC GOP Party") is False
+        assert scgop_source._is_valid_name("Republican Party") is False
+        assert scgop_source._is_valid_name("South Carolina GOP") is False
 
 
 class TestSCGOPCandidateParsing:
     """Tests for parsing candidates from markdown."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_parse_news_page(self):
+    def test_parse_news_page(self, scgop_source, fixture_markdown):
         """Should parse candidates from news page."""
-        markdown = (FIXTURES_DIR / "scgop_news.md").read_text()
-        candidates = self.source._parse_candidates(
+        markdown = fixture_markdown("scgop_news.md")
+        candidates = scgop_source._parse_candidates(
             markdown,
             "https://sc.gop/news"
         )
@@ -456,13 +445,9 @@ class TestSCGOPCandidateParsing:
             assert candidate.party_confidence == "HIGH"
             assert candidate.source == "scgop"
 
-    def test_parse_candidates_page(self):
+    def test_parse_candidates_page(self, scgop_roster_candidates):
         """Should parse candidates from candidates page."""
-        markdown = (FIXTURES_DIR / "scgop_candidates_page.md").read_text()
-        candidates = self.source._parse_candidates(
-            markdown,
-            "https://sc.gop/candidates"
-        )
+        candidates = scgop_roster_candidates
 
         # Should find multiple candidates
         assert len(candidates) >= 3
@@ -471,23 +456,19 @@ class TestSCGOPCandidateParsing:
         for candidate in candidates:
             assert candidate.party == "R"
 
-    def test_parse_incumbent_detection(self):
+    def test_parse_incumbent_detection(self, scgop_roster_candidates):
         """Should detect incumbent status."""
-        markdown = (FIXTURES_DIR / "scgop_candidates_page.md").read_text()
-        candidates = self.source._parse_candidates(
-            markdown,
-            "https://sc.gop/candidates"
-        )
+        candidates = scgop_roster_candidates
 
         # Find incumbents
         incumbents = [c for c in candidates if c.incumbent]
         # The fixture has some marked as incumbent
         # Note: may not find them depending on exact parsing
 
-    def test_parse_empty_page(self):
+    def test_parse_empty_page(self, scgop_source, fixture_markdown):
         """Should handle page with no candidates."""
-        markdown = (FIXTURES_DIR / "scgop_empty.md").read_text()
-        candidates = self.source._parse_candidates(
+        markdown = fixture_markdown("scgop_empty.md")
+        candidates = scgop_source._parse_candidates(
             markdown,
             "https://sc.gop/test"
         )
@@ -495,17 +476,17 @@ class TestSCGOPCandidateParsing:
         # Should return empty list
         assert candidates == []
 
-    def test_parse_none_markdown(self):
+    def test_parse_none_markdown(self, scgop_source):
         """Should handle None markdown."""
-        candidates = self.source._parse_candidates(
+        candidates = scgop_source._parse_candidates(
             None,
             "https://sc.gop/test"
         )
         assert candidates == []
 
-    def test_parse_empty_markdown(self):
+    def test_parse_empty_markdown(self, scgop_source):
         """Should handle empty markdown."""
-        candidates = self.source._parse_candidates(
+        candidates = scgop_source._parse_candidates(
             "",
             "https://sc.gop/test"
         )
@@ -515,33 +496,29 @@ class TestSCGOPCandidateParsing:
 class TestSCGOPCacheManagement:
     """Tests for SCGOP cache management."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_initial_cache_empty(self):
+    def test_initial_cache_empty(self, scgop_source):
         """Caches should be empty initially."""
-        stats = self.source.get_cache_stats()
+        stats = scgop_source.get_cache_stats()
         assert stats["pages_cached"] == 0
         assert stats["candidates_cached"] == 0
 
-    def test_clear_cache(self):
+    def test_clear_cache(self, scgop_source):
         """Clear cache should empty all caches."""
         # Add some test data to cache
-        self.source._page_cache["test_url"] = "test markdown"
-        self.source._candidates_cache = [
+        scgop_source._page_cache["test_url"] = "test markdown"
+        scgop_source._candidates_cache = group_by_district([
             DiscoveredCandidate(
                 name="Test Candidate",
                 district_id="SC-House-001",
                 source="scgop"
             )
-        ]
+        ])
 
         # Clear
-        self.source.clear_cache()
+        scgop_source.clear_cache()
 
         # Verify empty
-        stats = self.source.get_cache_stats()
+        stats = scgop_source.get_cache_stats()
         assert stats["pages_cached"] == 0
         assert stats["candidates_cached"] == 0
 
@@ -549,14 +526,10 @@ class TestSCGOPCacheManagement:
 class TestSCGOPExtractDistrictCandidates:
     """Tests for extract_district_candidates method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.source = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_extract_from_cache(self):
+    def test_extract_from_cache(self, scgop_source):
         """Should return cached candidates if available."""
         # Pre-populate cache
-        self.source._candidates_cache = [
+        scgop_source._candidates_cache = group_by_district([
             DiscoveredCandidate(
                 name="Republican Candidate",
                 district_id="SC-House-088",
@@ -569,16 +542,16 @@ class TestSCGOPExtractDistrictCandidates:
                 party="R",
                 source="scgop"
             )
-        ]
+        ])
 
         # Extract should return only matching district
-        result = self.source.extract_district_candidates("SC-House-088")
+        result = scgop_source.extract_district_candidates("SC-House-088")
         assert len(result) == 1
         assert result[0].name == "Republican Candidate"
 
-    def test_extract_no_cache(self):
+    def test_extract_no_cache(self, scgop_source):
         """Should return empty list if no cache available."""
-        result = self.source.extract_district_candidates("SC-House-999")
+        result = scgop_source.extract_district_candidates("SC-House-999")
         assert result == []
 
 
@@ -589,24 +562,19 @@ class TestSCGOPExtractDistrictCandidates:
 class TestPartySourceComparison:
     """Tests comparing SCDP and SCGOP sources."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.scdp = SCDPSource(firecrawl_api_key="test_key")
-        self.scgop = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_same_priority(self):
+    def test_same_priority(self, scdp_source, scgop_source):
         """Both party sources should have same priority."""
-        assert self.scdp.source_priority == self.scgop.source_priority == 3
+        assert scdp_source.source_priority == scgop_source.source_priority == 3
 
-    def test_different_parties(self):
+    def test_different_parties(self, scdp_source, scgop_source):
         """SCDP should produce D, SCGOP should produce R."""
         scdp_markdown = "**John Smith** - House District 42"
         scgop_markdown = "**Jane Doe** - House District 43"
 
-        scdp_candidates = self.scdp._parse_candidates(
+        scdp_candidates = scdp_source._parse_candidates(
             scdp_markdown, "https://scdp.org/test"
         )
-        scgop_candidates = self.scgop._parse_candidates(
+        scgop_candidates = scgop_source._parse_candidates(
             scgop_markdown, "https://sc.gop/test"
         )
 
@@ -616,15 +584,15 @@ class TestPartySourceComparison:
         for c in scgop_candidates:
             assert c.party == "R"
 
-    def test_high_confidence(self):
+    def test_high_confidence(self, scdp_source, scgop_source):
         """Both sources should have HIGH confidence for party."""
         scdp_markdown = "**John Smith** - House District 42"
         scgop_markdown = "**Jane Doe** - House District 43"
 
-        scdp_candidates = self.scdp._parse_candidates(
+        scdp_candidates = scdp_source._parse_candidates(
             scdp_markdown, "https://scdp.org/test"
         )
-        scgop_candidates = self.scgop._parse_candidates(
+        scgop_candidates = scgop_source._parse_candidates(
             scgop_markdown, "https://sc.gop/test"
         )
 
@@ -638,13 +606,11 @@ class TestRateLimiter:
 
     def test_scdp_default_rate_limit(self):
         """SCDP should use default rate limit from config."""
-        from config import FIRECRAWL_RPM
         source = SCDPSource(firecrawl_api_key="test_key")
         assert source.rate_limiter.rpm == FIRECRAWL_RPM
 
     def test_scgop_default_rate_limit(self):
         """SCGOP should use default rate limit from config."""
-        from config import FIRECRAWL_RPM
         source = SCGOPSource(firecrawl_api_key="test_key")
         assert source.rate_limiter.rpm == FIRECRAWL_RPM
 
@@ -659,33 +625,22 @@ class TestRateLimiter:
 class TestDiscoveredCandidateMetadata:
     """Tests for discovered candidate metadata."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.scdp = SCDPSource(firecrawl_api_key="test_key")
-        self.scgop = SCGOPSource(firecrawl_api_key="test_key")
-
-    def test_scdp_source_url(self):
+    def test_scdp_source_url(self, scdp_roster_candidates):
         """SCDP candidates should have correct source URL."""
-        markdown = (FIXTURES_DIR / "scdp_candidates_page.md").read_text()
         url = "https://scdp.org/candidates"
-        candidates = self.scdp._parse_candidates(markdown, url)
-
-        for c in candidates:
+        for c in scdp_roster_candidates:
             assert c.source_url == url
 
-    def test_scgop_source_url(self):
+    def test_scgop_source_url(self, scgop_roster_candidates):
         """SCGOP candidates should have correct source URL."""
-        markdown = (FIXTURES_DIR / "scgop_candidates_page.md").read_text()
         url = "https://sc.gop/candidates"
-        candidates = self.scgop._parse_candidates(markdown, url)
-
-        for c in candidates:
+        for c in scgop_roster_candidates:
             assert c.source_url == url
 
-    def test_discovered_date_set(self):
+    def test_discovered_date_set(self, scdp_source):
         """Candidates should have discovered_date set."""
         markdown = "**John Smith** - House District 42"
-        candidates = self.scdp._parse_candidates(
+        candidates = scdp_source._parse_candidates(
             markdown, "https://scdp.org/test"
         )
 
@@ -693,3 +648,8 @@ class TestDiscoveredCandidateMetadata:
             assert c.discovered_date is not None
             # Should be ISO format
             assert "T" in c.discovered_date
+
+    def test_discovered_date_shared_per_page(self, scgop_roster_candidates):
+        """Candidates parsed from one page should share one discovered_date."""
+        assert len(scgop_roster_candidates) > 1
+        assert len({c.discovered_date for c in scgop_roster_candidates}) == 1